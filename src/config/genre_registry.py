@@ -18,6 +18,7 @@ Design:
 
 from __future__ import annotations
 
+import functools
 from dataclasses import dataclass, field
 from typing import Dict, List, Optional, Tuple
 
@@ -125,6 +126,8 @@ SCALE_ALIASES: Dict[str, str] = {
     "freygish": "klezmer_freygish",
 }
 
+_ALL_SCALE_NAMES: Tuple[str, ...] = tuple(sorted(SCALES_EXTENDED.keys() | SCALE_ALIASES.keys()))
+
 
 # =====================================================================
 # GM_INSTRUMENTS_EXTENDED — merges original + world instruments
@@ -969,6 +972,40 @@ def _build_genre_tree() -> Dict[str, GenreNode]:
 # Build once at import time
 GENRE_TREE: Dict[str, GenreNode] = _build_genre_tree()
 
+# Sorted IDs never change after the tree is built, so sort them once
+_SORTED_GENRE_IDS: Tuple[str, ...] = tuple(sorted(GENRE_TREE))
+
+
+def _build_alias_index() -> Dict[str, GenreNode]:
+    """Map each lower-cased alias and display name to its genre.
+
+    Nodes are visited in registry order and the first claim on a key wins,
+    matching a linear scan over GENRE_TREE.
+    """
+    index: Dict[str, GenreNode] = {}
+    for node in GENRE_TREE.values():
+        for alias in node.aliases:
+            index.setdefault(alias.lower(), node)
+        index.setdefault(node.name.lower(), node)
+    return index
+
+
+_ALIAS_INDEX: Dict[str, GenreNode] = _build_alias_index()
+
+
+def _build_children_index() -> Dict[Optional[str], Tuple[GenreNode, ...]]:
+    """Map each parent ID to its direct children, in registry order.
+
+    Root genres are filed under ``None``, their (absent) parent.
+    """
+    children: Dict[Optional[str], List[GenreNode]] = {}
+    for node in GENRE_TREE.values():
+        children.setdefault(node.parent, []).append(node)
+    return {parent: tuple(nodes) for parent, nodes in children.items()}
+
+
+_CHILDREN_INDEX: Dict[Optional[str], Tuple[GenreNode, ...]] = _build_children_index()
+
 
 # =====================================================================
 # Helper functions
@@ -1002,15 +1039,12 @@ def get_root_genres() -> List[GenreNode]:
 
 def get_children(parent_id: str) -> List[GenreNode]:
     """Return direct children of a given genre ID."""
-    return [
-        n for n in GENRE_TREE.values()
-        if n.parent == parent_id
-    ]
+    return list(_CHILDREN_INDEX.get(parent_id, ()))
 
 
 def all_genre_ids() -> List[str]:
     """Return all registered genre IDs (sorted)."""
-    return sorted(GENRE_TREE.keys())
+    return list(_SORTED_GENRE_IDS)
 
 
 def get_genre_ids_for_validation() -> Tuple[str, ...]:
@@ -1018,7 +1052,7 @@ def get_genre_ids_for_validation() -> Tuple[str, ...]:
 
     This replaces the hardcoded SUPPORTED_GENRES tuple in schema.py.
     """
-    return tuple(sorted(GENRE_TREE.keys()))
+    return _SORTED_GENRE_IDS
 
 
 def get_tempo_ranges() -> Dict[str, Tuple[int, int]]:
@@ -1028,13 +1062,7 @@ def get_tempo_ranges() -> Dict[str, Tuple[int, int]]:
 
 def find_by_alias(alias: str) -> Optional[GenreNode]:
     """Find a genre by one of its aliases. Case-insensitive."""
-    alias_lower = alias.lower().strip()
-    for node in GENRE_TREE.values():
-        if alias_lower in (a.lower() for a in node.aliases):
-            return node
-        if alias_lower == node.name.lower():
-            return node
-    return None
+    return _ALIAS_INDEX.get(alias.lower().strip())
 
 
 def get_genre_instruments(genre_id: str) -> List[Tuple[str, str, int]]:
@@ -1042,31 +1070,42 @@ def get_genre_instruments(genre_id: str) -> List[Tuple[str, str, int]]:
 
     Falls back to parent genre if current has no instruments, then to pop.
     """
+    return list(_resolve_genre_instruments(genre_id))
+
+
+# The registry is immutable after import, so resolutions are memoized; callers
+# get a fresh list each time and may modify it freely.
+@functools.lru_cache(maxsize=256)
+def _resolve_genre_instruments(genre_id: str) -> Tuple[Tuple[str, str, int], ...]:
     node = get_genre(genre_id)
     if node is None:
         node = GENRE_TREE.get("pop")
     if node and node.instruments:
-        return list(node.instruments)
+        return node.instruments
     # Try parent
     if node and node.parent:
         parent = GENRE_TREE.get(node.parent)
         if parent and parent.instruments:
-            return list(parent.instruments)
-    return list(GENRE_TREE["pop"].instruments)
+            return parent.instruments
+    return GENRE_TREE["pop"].instruments
 
 
 def resolve_scale(scale_name: str) -> Optional[List[int]]:
     """Resolve a scale name (including aliases) to interval list."""
-    canonical = SCALE_ALIASES.get(scale_name.lower(), scale_name.lower())
+    intervals = _resolve_scale_intervals(scale_name.lower())
+    return list(intervals) if intervals is not None else None
+
+
+@functools.lru_cache(maxsize=256)
+def _resolve_scale_intervals(scale_name: str) -> Optional[Tuple[int, ...]]:
+    canonical = SCALE_ALIASES.get(scale_name, scale_name)
     scale = SCALES_EXTENDED.get(canonical)
     if scale is not None:
         # Convert any float intervals to int (for quarter-tone approximations)
-        return [int(i) for i in scale]
+        return tuple(int(i) for i in scale)
     return None
 
 
 def get_all_scale_names() -> Tuple[str, ...]:
     """Return all supported scale names (canonical + aliases)."""
-    names = set(SCALES_EXTENDED.keys())
-    names.update(SCALE_ALIASES.keys())
-    return tuple(sorted(names))
+    return _ALL_SCALE_NAMES
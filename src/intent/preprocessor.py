@@ -57,6 +57,38 @@ _ABBREVIATIONS: dict[str, str] = {
     r"\bperc\b": "percussion",
 }
 
+_ABBREVIATION_PATTERNS: tuple[tuple[re.Pattern[str], str], ...] = tuple(
+    (re.compile(pattern, re.IGNORECASE), replacement)
+    for pattern, replacement in _ABBREVIATIONS.items()
+)
+
+
+# ---- Hard-number patterns (compiled once) ---------------------------------
+
+_WHITESPACE_RE = re.compile(r"\s+")
+
+# Tempo: "120 bpm", "120 beats per minute", "tempo 120", "at 120"
+_TEMPO_RES = (
+    re.compile(r"(\d{2,3})\s*(?:bpm|beats?\s*per\s*min(?:ute)?)"),
+    re.compile(r"(?:tempo|at)\s+(\d{2,3})\b"),
+)
+_MM_SS_RE = re.compile(r"(\d{1,2}):(\d{2})\b")
+_M_S_RE = re.compile(r"(\d{1,2})\s*m\s*(\d{1,2})\s*s")
+_MINUTES_RE = re.compile(r"(\d{1,3})\s*(?:minutes?|mins?)\b")
+_SECONDS_RE = re.compile(r"(\d{1,4})\s*(?:seconds?|secs?)\b")
+_BARS_RE = re.compile(r"(\d{1,3})\s*(?:bars?|measures?)\b")
+_TRACKS_RE = re.compile(r"(\d{1,2})\s*[-\s]?(?:tracks?|instruments?)\b")
+_CHANNELS_RE = re.compile(r"(\d{1,2})\s*[-\s]?(?:channels?)\b")
+_ALT_MINUTES_RES = (
+    re.compile(r"(\d{1,3})\s*(?:minutes?|mins?)\s*(?:length|long)\b"),
+    re.compile(r"(?:of|about|around|approximately)\s+(\d{1,3})\s*(?:minutes?|mins?)"),
+)
+_MINUTE_LENGTH_RE = re.compile(
+    r"(\d{1,3})\s+.*?(?:of\s+)?(?:minutes?|mins?)\s*(?:length|long|duration)?"
+)
+_MINUTES_LENGTH_WORD_RE = re.compile(r"minutes?\s*(?:length|long|duration)")
+_TIME_SIGNATURE_RE = re.compile(r"\b(\d{1,2}/\d{1,2})\b")
+
 
 # ---- Extracted hard numbers dataclass ------------------------------------
 
@@ -104,15 +136,15 @@ def normalize_text(text: str) -> str:
     # Normalize unicode (NFC)
     text = unicodedata.normalize("NFC", text)
     # Collapse multiple spaces / tabs / newlines
-    text = re.sub(r"\s+", " ", text).strip()
+    text = _WHITESPACE_RE.sub(" ", text).strip()
     return text
 
 
 def expand_abbreviations(text: str) -> str:
     """Expand known music abbreviations for clarity."""
     result = text
-    for pattern, replacement in _ABBREVIATIONS.items():
-        result = re.sub(pattern, replacement, result, flags=re.IGNORECASE)
+    for pattern, replacement in _ABBREVIATION_PATTERNS:
+        result = pattern.sub(replacement, result)
     return result
 
 
@@ -130,12 +162,8 @@ def extract_hard_numbers(text: str) -> ExtractedNumbers:
     text_lower = text.lower()
 
     # Tempo: "120 bpm", "120 beats per minute", "tempo 120", "at 120"
-    tempo_patterns = [
-        r"(\d{2,3})\s*(?:bpm|beats?\s*per\s*min(?:ute)?)",
-        r"(?:tempo|at)\s+(\d{2,3})\b",
-    ]
-    for pat in tempo_patterns:
-        m = re.search(pat, text_lower)
+    for pat in _TEMPO_RES:
+        m = pat.search(text_lower)
         if m:
             val = int(m.group(1))
             if 30 <= val <= 300:
@@ -143,41 +171,41 @@ def extract_hard_numbers(text: str) -> ExtractedNumbers:
             break
 
     # Duration in MM:SS or Xm Ys format
-    mm_ss = re.search(r"(\d{1,2}):(\d{2})\b", text_lower)
+    mm_ss = _MM_SS_RE.search(text_lower)
     if mm_ss:
         mins, secs = int(mm_ss.group(1)), int(mm_ss.group(2))
         nums.duration_seconds = mins * 60 + secs
     else:
         # "2m30s", "2m 30s"
-        ms_match = re.search(r"(\d{1,2})\s*m\s*(\d{1,2})\s*s", text_lower)
+        ms_match = _M_S_RE.search(text_lower)
         if ms_match:
             nums.duration_seconds = int(ms_match.group(1)) * 60 + int(ms_match.group(2))
         else:
             # "X minutes"
-            min_match = re.search(r"(\d{1,3})\s*(?:minutes?|mins?)\b", text_lower)
+            min_match = _MINUTES_RE.search(text_lower)
             if min_match:
                 nums.duration_seconds = int(min_match.group(1)) * 60
 
             # "X seconds"  (only if no minutes found above)
             if nums.duration_seconds is None:
-                sec_match = re.search(r"(\d{1,4})\s*(?:seconds?|secs?)\b", text_lower)
+                sec_match = _SECONDS_RE.search(text_lower)
                 if sec_match:
                     nums.duration_seconds = int(sec_match.group(1))
 
     # Bars/measures
-    bar_match = re.search(r"(\d{1,3})\s*(?:bars?|measures?)\b", text_lower)
+    bar_match = _BARS_RE.search(text_lower)
     if bar_match:
         nums.duration_bars = int(bar_match.group(1))
 
     # Track count: "5 tracks", "create 5 track", "5-track"
-    track_match = re.search(r"(\d{1,2})\s*[-\s]?(?:tracks?|instruments?)\b", text_lower)
+    track_match = _TRACKS_RE.search(text_lower)
     if track_match:
         val = int(track_match.group(1))
         if 1 <= val <= 16:
             nums.track_count = val
 
     # Channel count: "8 channels", "8 channel", "8-channel"
-    channel_match = re.search(r"(\d{1,2})\s*[-\s]?(?:channels?)\b", text_lower)
+    channel_match = _CHANNELS_RE.search(text_lower)
     if channel_match:
         val = int(channel_match.group(1))
         if 1 <= val <= 16:
@@ -186,12 +214,8 @@ def extract_hard_numbers(text: str) -> ExtractedNumbers:
     # Infer duration from "N minutes length" or "of N minutes" if not already found
     # Handles: "5 minutes length", "of 3 minutes", "N minute long"
     if nums.duration_seconds is None:
-        alt_min_patterns = [
-            r"(\d{1,3})\s*(?:minutes?|mins?)\s*(?:length|long)\b",
-            r"(?:of|about|around|approximately)\s+(\d{1,3})\s*(?:minutes?|mins?)",
-        ]
-        for pat in alt_min_patterns:
-            m = re.search(pat, text_lower)
+        for pat in _ALT_MINUTES_RES:
+            m = pat.search(text_lower)
             if m:
                 nums.duration_seconds = int(m.group(1)) * 60
                 break
@@ -202,10 +226,7 @@ def extract_hard_numbers(text: str) -> ExtractedNumbers:
     # Only if we still don't have duration and the phrasing strongly suggests it.
     if nums.duration_seconds is None:
         # "X ... of minutes length" or "X ... minutes length" where X is nearby
-        min_length_match = re.search(
-            r"(\d{1,3})\s+.*?(?:of\s+)?(?:minutes?|mins?)\s*(?:length|long|duration)?",
-            text_lower,
-        )
+        min_length_match = _MINUTE_LENGTH_RE.search(text_lower)
         if min_length_match:
             candidate = int(min_length_match.group(1))
             # Only use if it's a plausible minute count (1-60) and not already
@@ -214,11 +235,11 @@ def extract_hard_numbers(text: str) -> ExtractedNumbers:
             if 1 <= candidate <= 60:
                 # Check that "minutes" appears after this number's context
                 after_num = text_lower[min_length_match.start():]
-                if re.search(r"minutes?\s*(?:length|long|duration)", after_num):
+                if _MINUTES_LENGTH_WORD_RE.search(after_num):
                     nums.duration_seconds = candidate * 60
 
     # Time signature: "3/4", "6/8", "4/4"
-    ts_match = re.search(r"\b(\d{1,2}/\d{1,2})\b", text)
+    ts_match = _TIME_SIGNATURE_RE.search(text)
     if ts_match:
         nums.time_signature = ts_match.group(1)
 
@@ -39,6 +39,8 @@ logger = logging.getLogger(__name__)
 # Sentinel data markers (not user-visible prompts)
 _MARKER_LOADING = "__loading__"
 _MARKER_MORE = "__more__"
+# Genre nodes carry ``(_GENRE_TAG, genre_id)`` as their data
+_GENRE_TAG = "genre"
 
 # Retry / rate-limit constants
 _MAX_RETRIES = 2          # 1 initial + 2 retries = 3 total attempts
@@ -47,17 +49,26 @@ _MIN_CALL_GAP = 2.0       # minimum seconds between any two LLM sidebar calls
 _ERROR_DISMISS_SECS = 5.0 # auto-clear error status after this many seconds
 
 
+def _elide(text: str, limit: int) -> str:
+    """Truncate *text* to *limit* characters, marking the cut with an ellipsis."""
+    return text if len(text) <= limit else text[:limit] + "…"
+
+
 class Sidebar(Static):
     """Left sidebar with dynamic genre preset tree and generation history."""
 
     class PresetSelected(Message):
         """A preset prompt was clicked."""
+        __slots__ = ("prompt",)
+
         def __init__(self, prompt: str) -> None:
             super().__init__()
             self.prompt = prompt
 
     class HistorySelected(Message):
         """A history entry was clicked."""
+        __slots__ = ("prompt",)
+
         def __init__(self, prompt: str) -> None:
             super().__init__()
             self.prompt = prompt
@@ -67,17 +78,18 @@ class Sidebar(Static):
         self._svc: PresetService = get_preset_service()
         # Track which genre nodes have been populated
         self._populated: set[str] = set()
-        # Map tree node IDs to genre IDs for expansion handling
-        self._node_genre_map: dict[int, str] = {}
         # Reference to presets root node
         self._presets_node: Optional[TreeNode] = None
         self._history_node: Optional[TreeNode] = None
+        # Signature of the history entries last rendered (skip no-op refreshes)
+        self._history_sig: Optional[int] = None
 
         # ── Fault-tolerance state ───────────────────────────────
         # Sidebar-level duplicate detection: genre_id → set of normalised prompts
         self._generated_prompts: dict[str, set[str]] = {}
-        # Genres currently being loaded (concurrency guard)
-        self._loading_genres: set[str] = set()
+        # Genres currently being loaded (concurrency guard).  Only touched on
+        # the UI thread: workers report back through call_from_thread.
+        self._inflight: set[str] = set()
         # Timestamp of last LLM call (rate limiter)
         self._last_llm_call: float = 0.0
 
@@ -87,7 +99,7 @@ class Sidebar(Static):
 
     def compose(self) -> ComposeResult:
         yield Label("", id="sidebar-status")
-        tree: Tree[str] = Tree("🎵 Presets", id="sidebar-tree")
+        tree: Tree[str | tuple[str, str]] = Tree("🎵 Presets", id="sidebar-tree")
         tree.root.expand()
         yield tree
 
@@ -128,49 +140,54 @@ class Sidebar(Static):
     def _build_tree(self) -> None:
         """Build the full sidebar tree: Presets (root) + History."""
         tree = self.query_one("#sidebar-tree", Tree)
-        tree.clear()
-        self._node_genre_map.clear()
-        self._populated.clear()
-
-        # ── Presets section (Level 1: root genres) ──────────────
-        self._presets_node = tree.root
-        roots = self._svc.get_root_categories()
-        for root_genre in roots:
-            display = self._svc.get_display_name(root_genre)
-            root_node = tree.root.add(display)
-            self._node_genre_map[root_node.id] = root_genre.id
-
-            # Level 2: sub-genres (all collapsed)
-            subs = self._svc.get_sub_genres(root_genre.id)
-            if subs:
-                for sub in subs:
-                    sub_node = root_node.add(sub.name)
-                    self._node_genre_map[sub_node.id] = sub.id
-                    # Add a placeholder so the node shows as expandable
-                    sub_node.add_leaf("⏳ Expand to load prompts…", data=_MARKER_LOADING)
-            else:
-                # Root genre with no children — add placeholder for direct prompts
-                root_node.add_leaf("⏳ Expand to load prompts…", data=_MARKER_LOADING)
-
-        # ── History section ─────────────────────────────────────
-        self._history_node = tree.root.add("📂 History")
-        self._history_node.expand()
-        self._populate_history()
+        # Suspend repaints so the whole tree renders once, not per node
+        with self.app.batch_update():
+            tree.clear()
+            self._populated.clear()
+
+            # ── Presets section (Level 1: root genres) ──────────────
+            self._presets_node = tree.root
+            roots = self._svc.get_root_categories()
+            for root_genre in roots:
+                display = self._svc.get_display_name(root_genre)
+                root_node = tree.root.add(display, data=(_GENRE_TAG, root_genre.id))
+
+                # Level 2: sub-genres (all collapsed)
+                subs = self._svc.get_sub_genres(root_genre.id)
+                if subs:
+                    for sub in subs:
+                        sub_node = root_node.add(sub.name, data=(_GENRE_TAG, sub.id))
+                        # Add a placeholder so the node shows as expandable
+                        sub_node.add_leaf("⏳ Expand to load prompts…", data=_MARKER_LOADING)
+                else:
+                    # Root genre with no children — add placeholder for direct prompts
+                    root_node.add_leaf("⏳ Expand to load prompts…", data=_MARKER_LOADING)
+
+            # ── History section ─────────────────────────────────────
+            self._history_node = tree.root.add("📂 History")
+            self._history_node.expand()
+            self._history_sig = None
+            self._populate_history()
 
     def _populate_history(self) -> None:
         """Populate (or repopulate) the history subtree."""
         if self._history_node is None:
             return
+        entries = HistoryManager.get_entries(limit=20)
+        sig = hash(tuple(
+            (e.get("prompt", ""), e.get("genre", ""), e.get("quality", 0))
+            for e in entries
+        ))
+        if sig == self._history_sig:
+            return  # Nothing changed since the last render
+        self._history_sig = sig
         # Clear existing history children
         self._history_node.remove_children()
-        entries = HistoryManager.get_entries(limit=20)
         if not entries:
             self._history_node.add_leaf("(no history yet)")
         else:
             for entry in entries:
-                label = entry.get("prompt", "")[:40]
-                if len(entry.get("prompt", "")) > 40:
-                    label += "…"
+                label = _elide(entry.get("prompt", ""), 40)
                 genre_tag = entry.get("genre", "")
                 quality = entry.get("quality", 0)
                 display = f"{label}  [{genre_tag} {quality:.0%}]" if genre_tag else label
@@ -264,9 +281,10 @@ class Sidebar(Static):
         """When a genre/sub-genre node is expanded, load prompts via LLM."""
         try:
             node: TreeNode = event.node
-            genre_id = self._node_genre_map.get(node.id)
-            if genre_id is None:
+            tag = node.data
+            if not isinstance(tag, tuple) or tag[0] != _GENRE_TAG:
                 return  # Not a genre node (e.g., history, root)
+            genre_id = tag[1]
 
             if genre_id in self._populated:
                 return  # Already loaded
@@ -285,12 +303,22 @@ class Sidebar(Static):
             self._set_status("Something went wrong", error=True)
             self.set_timer(_ERROR_DISMISS_SECS, self._clear_status)
 
+    def _claim_genre(self, genre_id: str) -> bool:
+        """Mark *genre_id* as loading; False if it is already in flight."""
+        if genre_id in self._inflight:
+            return False
+        self._inflight.add(genre_id)
+        return True
+
+    def _release_genre(self, genre_id: str) -> None:
+        """Release the concurrency guard for *genre_id* (idempotent)."""
+        self._inflight.discard(genre_id)
+
     def _load_presets_async(self, node: TreeNode, genre_id: str) -> None:
         """Load presets in a background thread, then update the tree."""
         # ── Concurrency guard ────────────────────────────────────
-        if genre_id in self._loading_genres:
+        if not self._claim_genre(genre_id):
             return
-        self._loading_genres.add(genre_id)
         self._populated.add(genre_id)
 
         # Remove the placeholder
@@ -322,15 +350,14 @@ class Sidebar(Static):
         """Callback: replace spinner with actual prompt leaves."""
         try:
             # Release concurrency guard
-            self._loading_genres.discard(genre_id)
+            self._release_genre(genre_id)
 
             node.remove_children()
 
             if prompts:
                 self._register_prompts(genre_id, prompts)
                 for prompt in prompts:
-                    label = prompt[:50] + "…" if len(prompt) > 50 else prompt
-                    node.add_leaf(label, data=prompt)
+                    node.add_leaf(_elide(prompt, 50), data=prompt)
             else:
                 node.add_leaf("(no ideas available)", data=_MARKER_LOADING)
 
@@ -340,7 +367,7 @@ class Sidebar(Static):
             self._clear_status()
         except Exception as exc:
             logger.exception("_on_presets_loaded callback error: %s", exc)
-            self._loading_genres.discard(genre_id)
+            self._release_genre(genre_id)
             self._clear_status()
 
     def _on_load_failed(
@@ -348,18 +375,18 @@ class Sidebar(Static):
     ) -> None:
         """Callback: show graceful failure state in the tree."""
         try:
-            self._loading_genres.discard(genre_id)
+            self._release_genre(genre_id)
             node.remove_children()
             node.add_leaf("(no ideas available)", data=_MARKER_LOADING)
             node.add_leaf("🔄 Retry", data=f"{_MARKER_MORE}:{genre_id}")
             node.expand()
 
-            short = (error_msg[:60] + "…") if len(error_msg) > 60 else error_msg
+            short = _elide(error_msg, 60)
             self._set_status(f"Could not load ideas: {short}", error=True)
             self.set_timer(_ERROR_DISMISS_SECS, self._clear_status)
         except Exception as exc:
             logger.exception("_on_load_failed callback error: %s", exc)
-            self._loading_genres.discard(genre_id)
+            self._release_genre(genre_id)
             self._clear_status()
 
     # ------------------------------------------------------------------ #
@@ -374,9 +401,8 @@ class Sidebar(Static):
             return
 
         # ── Concurrency guard ────────────────────────────────────
-        if genre_id in self._loading_genres:
+        if not self._claim_genre(genre_id):
             return
-        self._loading_genres.add(genre_id)
 
         # Remove the "More ideas" leaf, add spinner
         node.remove()
@@ -411,14 +437,13 @@ class Sidebar(Static):
     ) -> None:
         """Callback: append new prompts after the existing ones."""
         try:
-            self._loading_genres.discard(genre_id)
+            self._release_genre(genre_id)
             spinner.remove()
 
             if prompts:
                 self._register_prompts(genre_id, prompts)
                 for prompt in prompts:
-                    label = prompt[:50] + "…" if len(prompt) > 50 else prompt
-                    parent.add_leaf(label, data=prompt)
+                    parent.add_leaf(_elide(prompt, 50), data=prompt)
             else:
                 parent.add_leaf("(no new ideas)", data=_MARKER_LOADING)
 
@@ -427,7 +452,7 @@ class Sidebar(Static):
             self._clear_status()
         except Exception as exc:
             logger.exception("_on_more_loaded callback error: %s", exc)
-            self._loading_genres.discard(genre_id)
+            self._release_genre(genre_id)
             self._clear_status()
 
     def _on_more_failed(
@@ -439,16 +464,16 @@ class Sidebar(Static):
     ) -> None:
         """Callback: graceful failure for 'More ideas'."""
         try:
-            self._loading_genres.discard(genre_id)
+            self._release_genre(genre_id)
             spinner.remove()
             parent.add_leaf("🔄 More ideas", data=f"{_MARKER_MORE}:{genre_id}")
 
-            short = (error_msg[:60] + "…") if len(error_msg) > 60 else error_msg
+            short = _elide(error_msg, 60)
             self._set_status(f"Could not generate ideas: {short}", error=True)
             self.set_timer(_ERROR_DISMISS_SECS, self._clear_status)
         except Exception as exc:
             logger.exception("_on_more_failed callback error: %s", exc)
-            self._loading_genres.discard(genre_id)
+            self._release_genre(genre_id)
             self._clear_status()
 
     # ------------------------------------------------------------------ #
@@ -495,6 +520,7 @@ class Sidebar(Static):
     def refresh_history(self) -> None:
         """Rebuild only the history section (preserves preset tree state)."""
         try:
-            self._populate_history()
+            with self.app.batch_update():
+                self._populate_history()
         except Exception as exc:
             logger.exception("refresh_history error: %s", exc)
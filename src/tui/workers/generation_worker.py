@@ -10,28 +10,53 @@ from __future__ import annotations
 import time
 import uuid
 import logging
+import threading
 from pathlib import Path
-from typing import Any, Dict
+from typing import TYPE_CHECKING, Any, Dict
 
 from textual.message import Message
 from textual.worker import Worker, WorkerState
 
 from src.config.constants import OUTPUT_DIR
 
+if TYPE_CHECKING:
+    from src.agents.state import MusicState
+
 logger = logging.getLogger(__name__)
 
+# State keys whose first non-None value signals that a graph node has run
+_KEY_TO_NODE: Dict[str, str] = {
+    "intent": "intent_parser",
+    "track_plan": "track_planner",
+    "theory_validation": "theory_validator",
+    "theory_valid": "theory_validator",
+    "generated_tracks": "track_generator",
+    "quality_report": "quality_control",
+    "refinement_feedback": "refinement",
+    "final_midi_path": "midi_creator",
+    "session_summary": "session_summary",
+}
+_WATCHED_KEYS = frozenset(_KEY_TO_NODE)
+
+_graph: Any = None
+_GRAPH_LOCK = threading.Lock()
+
 
 # ------------------------------------------------------------------ #
 # Messages posted from the worker to the app
 # ------------------------------------------------------------------ #
 
 class NodeStarted(Message):
+    __slots__ = ("node_name",)
+
     def __init__(self, node_name: str) -> None:
         super().__init__()
         self.node_name = node_name
 
 
 class NodeCompleted(Message):
+    __slots__ = ("node_name", "elapsed")
+
     def __init__(self, node_name: str, elapsed: float) -> None:
         super().__init__()
         self.node_name = node_name
@@ -39,12 +64,16 @@ class NodeCompleted(Message):
 
 
 class GenerationComplete(Message):
+    __slots__ = ("result_state",)
+
     def __init__(self, result_state: Dict[str, Any]) -> None:
         super().__init__()
         self.result_state = result_state
 
 
 class GenerationError(Message):
+    __slots__ = ("error",)
+
     def __init__(self, error: str) -> None:
         super().__init__()
         self.error = error
@@ -54,21 +83,24 @@ class GenerationError(Message):
 # Worker function (called via app.run_worker)
 # ------------------------------------------------------------------ #
 
-async def run_generation(prompt: str, app: Any) -> Dict[str, Any]:
-    """Execute the full LangGraph pipeline in a worker thread.
+def _get_graph() -> Any:
+    """Compile the agentic graph on first use and reuse it afterwards.
 
-    NOTE: This function is CPU-bound / IO-bound (LLM calls) and runs
-    in a *thread* via Textual's ``run_worker(..., thread=True)``.
-    We import heavy modules inside the function to keep the TUI startup fast.
+    Each run streams with its own ``thread_id``.  The shared in-memory
+    checkpointer keeps every thread's checkpoints, so ``run_generation``
+    deletes its thread once the run ends.
     """
-    from src.agents.graph import get_agentic_graph
-    from src.agents.state import MusicState
+    global _graph
+    with _GRAPH_LOCK:
+        if _graph is None:
+            from src.agents.graph import get_agentic_graph
+            _graph = get_agentic_graph()
+    return _graph
 
-    # Ensure outputs/ exists
-    OUTPUT_DIR.mkdir(exist_ok=True)
 
-    session_id = str(uuid.uuid4())[:8]
-    initial_state: MusicState = {
+def _build_initial_state(prompt: str, session_id: str) -> MusicState:
+    """Return a fresh initial graph state for one generation run."""
+    return {
         "user_prompt": prompt,
         "intent": None,
         "track_plan": [],
@@ -98,11 +130,26 @@ async def run_generation(prompt: str, app: Any) -> Dict[str, Any]:
         "current_iteration": 0,
     }
 
+
+async def run_generation(prompt: str, app: Any) -> Dict[str, Any]:
+    """Execute the full LangGraph pipeline in a worker thread.
+
+    NOTE: This function is CPU-bound / IO-bound (LLM calls) and runs
+    in a *thread* via Textual's ``run_worker(..., thread=True)``.
+    The graph is imported and compiled lazily (once) to keep the TUI startup fast.
+    """
+    # Ensure outputs/ exists
+    OUTPUT_DIR.mkdir(exist_ok=True)
+
+    session_id = str(uuid.uuid4())[:8]
+    initial_state = _build_initial_state(prompt, session_id)
+
     config = {"configurable": {"thread_id": session_id}}
-    graph = get_agentic_graph()
+    graph = _get_graph()
 
     # Stream through the graph to get per-node progress
     previous_keys: set = set()
+    completed_nodes: set = set()
     node_order = [
         "intent_parser", "track_planner", "theory_validator",
         "track_generator", "quality_control", "refinement",
@@ -114,35 +161,25 @@ async def run_generation(prompt: str, app: Any) -> Dict[str, Any]:
     try:
         for chunk in graph.stream(initial_state, config=config, stream_mode="values"):
             # Determine which node just completed by checking new keys
-            current_keys = set(k for k, v in chunk.items() if v is not None and k not in (
-                "user_prompt", "messages", "session_id", "composition_state",
-                "max_refinement_iterations", "current_iteration",
-            ))
+            current_keys = {k for k in _WATCHED_KEYS if chunk.get(k) is not None}
             new_keys = current_keys - previous_keys
-            previous_keys = current_keys
+            previous_keys |= new_keys
             last_state = chunk
 
-            # Heuristic: map new keys to nodes
-            key_to_node = {
-                "intent": "intent_parser",
-                "track_plan": "track_planner",
-                "theory_validation": "theory_validator",
-                "theory_valid": "theory_validator",
-                "generated_tracks": "track_generator",
-                "quality_report": "quality_control",
-                "refinement_feedback": "refinement",
-                "final_midi_path": "midi_creator",
-                "session_summary": "session_summary",
-            }
-            for key in new_keys:
-                node = key_to_node.get(key)
-                if node:
-                    app.post_message(NodeCompleted(node, 0.0))
+            # Heuristic: map new keys to nodes, posting each node only once
+            newly_completed = {_KEY_TO_NODE[k] for k in new_keys} - completed_nodes
+            for node in newly_completed:
+                completed_nodes.add(node)
+                app.post_message(NodeCompleted(node, 0.0))
 
     except Exception as exc:
         logger.exception("Generation pipeline failed")
         app.post_message(GenerationError(str(exc)))
         return last_state
+    finally:
+        # Nothing resumes a finished run; free its checkpoints
+        if graph.checkpointer is not None:
+            graph.checkpointer.delete_thread(session_id)
 
     # Check for errors in the final state
     if last_state.get("error"):
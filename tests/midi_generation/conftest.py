@@ -7,7 +7,6 @@ from __future__ import annotations
 
 import os
 import sys
-import uuid
 import pytest
 from pathlib import Path
 
@@ -21,6 +20,33 @@ except ImportError:
 
 from src.config.llm import LLMConfig
 from src.agents.graph import get_agentic_graph
+from tests.midi_generation.evaluator import MidiEvaluator
+from tests.midi_generation.test_cases import TestCase
+
+
+# ── pytest-xdist support ─────────────────────────────────────────────────────
+
+
+def pytest_configure(config):
+    # pytest-xdist registers this marker itself; declare it so plain runs
+    # don't warn about an unknown mark.
+    config.addinivalue_line(
+        "markers", "xdist_group(name): run all tests of a group on one xdist worker"
+    )
+
+
+def pytest_collection_modifyitems(items):
+    """Group both tests of a ``TestCase`` onto one xdist worker.
+
+    With ``--dist loadgroup`` the content test then runs after the
+    structural test on the same worker and reuses the MIDI it generated,
+    instead of a second worker generating the same case again.
+    """
+    for item in items:
+        callspec = getattr(item, "callspec", None)
+        tc = callspec.params.get("tc") if callspec is not None else None
+        if isinstance(tc, TestCase):
+            item.add_marker(pytest.mark.xdist_group(name=tc.test_id))
 
 
 # ── Session-scoped fixtures ──────────────────────────────────────────────────
@@ -39,9 +65,36 @@ def agentic_graph():
     return get_agentic_graph()
 
 
+@pytest.fixture(scope="session")
+def evaluator() -> MidiEvaluator:
+    """One stateless ``MidiEvaluator`` shared by every test in the session.
+
+    Created on first use, so ``--collect-only`` and deselected runs never
+    import the MIDI parser backend.
+    """
+    MidiEvaluator.preload_backend()
+    return MidiEvaluator()
+
+
 @pytest.fixture(scope="session")
 def output_dir() -> Path:
     """Directory where test-generated MIDI files are stored."""
     p = _REPO_ROOT / "tests" / "midi_generation" / "outputs"
     p.mkdir(parents=True, exist_ok=True)
     return p
+
+
+@pytest.fixture(scope="session")
+def existing_outputs(output_dir: Path) -> dict[str, str]:
+    """``test_id`` → path of a MIDI file already in *output_dir*.
+
+    The directory is scanned once per session; tests add the files they
+    generate so the content test for a case finds them without a rescan.
+    """
+    index: dict[str, str] = {}
+    with os.scandir(output_dir) as entries:
+        for entry in entries:
+            if entry.name.endswith(".mid"):
+                # "tc_001_<rest>.mid" → "tc_001"
+                index.setdefault("_".join(entry.name.split("_", 2)[:2]), entry.path)
+    return index
@@ -20,27 +20,71 @@ Run a specific test by ID:
 
     uv run python tests/midi_generation/runner.py --filter tc_001
 
+Run an explicit set of tests:
+
+    uv run python tests/midi_generation/runner.py --filter tc_001,tc_014,tc_090
+
+Run every jazz case (genre tags are listed in ``test_cases._GENRE_KEYWORDS``):
+
+    uv run python tests/midi_generation/runner.py --genre jazz
+
+Generate up to 8 cases at a time (default 4):
+
+    uv run python tests/midi_generation/runner.py --concurrency 8
+
+Every run generates fresh MIDI by default.  Pass ``--cache`` to reuse
+successful generations cached per (provider, prompt) under
+``~/.cache/text2midi/generations``, or ``--refresh-cache`` to regenerate and
+overwrite those entries.  The cache key ignores code changes, so leave it off
+when checking generator changes:
+
+    uv run python tests/midi_generation/runner.py --cache
+
 Dry-run mode (evaluate already-generated files, skip LLM):
 
     uv run python tests/midi_generation/runner.py --dry-run
 
 Output files are written to:
   tests/midi_generation/outputs/     – generated MIDI files
-  tests/midi_generation/reports/     – JSON + Markdown reports
+  tests/midi_generation/reports/     – JSON + Markdown reports, plus a flat
+                                       per-test table (Parquet, or CSV
+                                       without pyarrow)
 """
 
 from __future__ import annotations
 
 import argparse
+import asyncio
+import csv
+import hashlib
 import json
 import os
+import random
+import re
+import secrets
+import shutil
 import sys
 import time
 import traceback
-import uuid
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import cached_property
 from pathlib import Path
 
+try:
+    import orjson
+    _ORJSON_AVAILABLE = True
+except ImportError:
+    _ORJSON_AVAILABLE = False
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    _PYARROW_AVAILABLE = True
+except ImportError:
+    _PYARROW_AVAILABLE = False
+
 # ── Repo root for .env loading ─────────────────────────────────
 _REPO_ROOT = Path(__file__).resolve().parent.parent.parent
 
@@ -52,7 +96,13 @@ from src.config.llm import LLMConfig, call_llm   # noqa: E402 (after path setup)
 from src.agents.graph import get_agentic_graph     # noqa: E402
 from src.agents.state import MusicState            # noqa: E402
 from tests.midi_generation.evaluator import MidiEvaluator  # noqa: E402
-from tests.midi_generation.test_cases import TEST_CASES, TestCase  # noqa: E402
+from tests.midi_generation.test_cases import (  # noqa: E402
+    GENRE_TAGS,
+    TEST_CASES,
+    TEST_CASES_BY_ID,
+    TestCase,
+    cases_for_genre,
+)
 
 # ── Constants ────────────────────────────────────────────────────────────────
 OUTPUTS_DIR = _REPO_ROOT / "tests" / "midi_generation" / "outputs"
@@ -60,8 +110,28 @@ REPORTS_DIR = _REPO_ROOT / "tests" / "midi_generation" / "reports"
 OUTPUTS_DIR.mkdir(parents=True, exist_ok=True)
 REPORTS_DIR.mkdir(parents=True, exist_ok=True)
 
-# Delay between test cases to avoid hammering the API rate-limit
-INTER_TEST_DELAY_SECONDS = 1.5
+# Generation starts per minute; starts are spaced evenly to stay under the
+# provider's request quota (40/min ≙ one start every 1.5 s)
+DEFAULT_RPM = 40
+
+# Rate-limited generations are retried with full-jitter exponential backoff
+DEFAULT_MAX_RETRIES = 3
+RETRY_BACKOFF_BASE_SECONDS = 2.0
+RETRY_BACKOFF_CAP_SECONDS = 30.0
+
+# Generations in flight at once (each one is a chain of remote LLM calls)
+DEFAULT_CONCURRENCY = 4
+
+# Generated MIDI keyed by (provider, prompt), reused across runs with --cache
+GENERATION_CACHE_DIR = (
+    Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "text2midi" / "generations"
+)
+
+# Threads that score cases while later generations are still in flight
+EVAL_WORKERS = os.cpu_count() or 1
+
+# Stateless, so one instance per process serves every test case
+EVALUATOR = MidiEvaluator()
 
 
 # ============================================================================
@@ -69,7 +139,7 @@ INTER_TEST_DELAY_SECONDS = 1.5
 # ============================================================================
 
 
-def _build_initial_state(test_case: TestCase, session_id: str) -> MusicState:
+def build_initial_state(test_case: TestCase, session_id: str) -> MusicState:
     """Create the initial ``MusicState`` dict for a test case."""
     return {
         "user_prompt": test_case.prompt,
@@ -106,15 +176,18 @@ def generate_midi_for_test(
     test_case: TestCase,
     graph,
     output_dir: Path,
-) -> tuple[str | None, str | None, float]:
+) -> tuple[str | None, str | BaseException | None, float]:
     """Run the agentic graph for one test case.
 
     Returns
     -------
-    (midi_path, error_message, elapsed_seconds)
+    (midi_path, error, elapsed_seconds)
+        *error* is a message, or the raised exception itself so that its
+        traceback is only formatted when a report is written
+        (see ``format_gen_error``).
     """
-    session_id = str(uuid.uuid4())[:8]
-    initial_state = _build_initial_state(test_case, session_id)
+    session_id = secrets.token_hex(4)
+    initial_state = build_initial_state(test_case, session_id)
     config = {"configurable": {"thread_id": session_id}}
 
     t0 = time.monotonic()
@@ -140,7 +213,175 @@ def generate_midi_for_test(
 
     except Exception as exc:
         elapsed = time.monotonic() - t0
-        return None, f"{type(exc).__name__}: {exc}\n{traceback.format_exc()}", elapsed
+        return None, exc, elapsed
+
+
+def _generation_cache_key(test_case: TestCase) -> str:
+    """Content address for a generation: provider + prompt."""
+    raw = f"{LLMConfig.DEFAULT_PROVIDER}\0{test_case.prompt}"
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+def cached_generation_path(test_case: TestCase) -> Path | None:
+    """Return the cached MIDI for *test_case* in the cache dir; ``None`` on miss."""
+    key = _generation_cache_key(test_case)
+    cached = GENERATION_CACHE_DIR / f"{key}.mid"
+    try:
+        meta = json.loads((GENERATION_CACHE_DIR / f"{key}.json").read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    # Sidecar guards against stale or colliding entries
+    if meta.get("provider") != LLMConfig.DEFAULT_PROVIDER or meta.get("prompt") != test_case.prompt:
+        return None
+    if not cached.is_file():
+        return None
+    return cached
+
+
+def load_cached_generation(test_case: TestCase, output_dir: Path) -> str | None:
+    """Copy a cached MIDI for *test_case* into *output_dir*; ``None`` on miss."""
+    cached = cached_generation_path(test_case)
+    if cached is None:
+        return None
+    key = _generation_cache_key(test_case)
+    dest = output_dir / f"{test_case.test_id}_cached_{key[:12]}.mid"
+    shutil.copy2(cached, dest)
+    return str(dest)
+
+
+def store_cached_generation(test_case: TestCase, midi_path: str) -> None:
+    """Save a freshly generated MIDI (and its provider/prompt sidecar) to the cache."""
+    key = _generation_cache_key(test_case)
+    try:
+        GENERATION_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        shutil.copy2(midi_path, GENERATION_CACHE_DIR / f"{key}.mid")
+        meta = {
+            "provider": LLMConfig.DEFAULT_PROVIDER,
+            "prompt": test_case.prompt,
+            "test_id": test_case.test_id,
+            "created": datetime.utcnow().isoformat() + "Z",
+        }
+        (GENERATION_CACHE_DIR / f"{key}.json").write_text(json.dumps(meta), encoding="utf-8")
+    except OSError as exc:
+        print(f"         [cache] could not store {test_case.test_id}: {exc}")
+
+
+# Whole-word status only, so timestamps, hex ids and paths containing "429"
+# (e.g. "..._071429.mid") are not mistaken for a rate limit
+_RATE_LIMIT_RE = re.compile(r"\b429\b|rate ?limit", re.IGNORECASE)
+
+
+def _is_rate_limited(error: str | BaseException | None) -> bool:
+    """Whether a generation error looks like a provider rate limit (HTTP 429)."""
+    if error is None:
+        return False
+    if getattr(error, "status_code", None) == 429:
+        return True
+    return _RATE_LIMIT_RE.search(str(error)) is not None
+
+
+def format_gen_error(error: str | BaseException | None, *, with_traceback: bool = False) -> str:
+    """Render a generation error from ``generate_midi_for_test`` as text."""
+    if error is None:
+        return ""
+    if not isinstance(error, BaseException):
+        return error
+    message = f"{type(error).__name__}: {error}"
+    if with_traceback:
+        message += "\n" + "".join(traceback.format_exception(error))
+    return message
+
+
+def evaluate_test_case(test_case: TestCase, midi_path: str | None):
+    """Score one generated file against its test case's expectations."""
+    return EVALUATOR.evaluate(
+        test_id=test_case.test_id,
+        prompt=test_case.prompt,
+        midi_path=midi_path,
+        expected_tempo_range=test_case.expected_tempo_range,
+        expected_track_count_range=test_case.expected_track_count_range,
+        expected_note_count_range=test_case.expected_note_count_range,
+        expected_duration_range=test_case.expected_duration_range,
+        expected_pitch_range=test_case.expected_pitch_range,
+        expected_has_drums=test_case.expected_has_drums,
+        pass_threshold=test_case.pass_threshold,
+    )
+
+
+# ============================================================================
+# Reporting helpers
+# ============================================================================
+
+def _json_bytes(value) -> bytes:
+    """Compact UTF-8 JSON for one report value (orjson when installed)."""
+    if _ORJSON_AVAILABLE:
+        return orjson.dumps(value, default=str)
+    return json.dumps(value, default=str, ensure_ascii=False).encode("utf-8")
+
+
+def _flatten_result(r: dict) -> dict:
+    """One flat row per test for the tabular report."""
+    row = {
+        "test_id":        r["test_id"],
+        "passed":         r["passed"],
+        "weighted_score": r["weighted_score"],
+        "pass_threshold": r["pass_threshold"],
+        "elapsed_s":      r["elapsed_s"],
+        "file_parseable": r["structural"]["file_parseable"],
+        "gen_failed":     bool(r["gen_error"]),
+    }
+    row.update({f"score_{k}": v for k, v in r["dimension_scores"].items()})
+    row.update(r["metrics"])
+    return row
+
+
+# (report key, MidiMetrics attribute, rounding digits or None)
+_METRIC_SPEC = (
+    ("bpm",             "bpm",                   1),
+    ("tracks",          "non_empty_track_count", None),
+    ("notes",           "total_notes",           None),
+    ("duration_s",      "duration_seconds",      1),
+    ("avg_pitch",       "avg_pitch",             1),
+    ("vel_stddev",      "velocity_stddev",       1),
+    ("has_drums",       "has_drums",             None),
+    ("file_size_bytes", "file_size_bytes",       None),
+)
+
+
+def _pack_metrics(metrics) -> dict:
+    """Flatten a ``MidiMetrics`` into the report's ``metrics`` block (all None if absent)."""
+    if metrics is None:
+        return dict.fromkeys(key for key, _, _ in _METRIC_SPEC)
+    return {
+        key: getattr(metrics, attr) if digits is None else round(getattr(metrics, attr), digits)
+        for key, attr, digits in _METRIC_SPEC
+    }
+
+
+_MD_ROW_TEMPLATE = (
+    "| {id_short} | `{test_id}` | {status} | {score} | {bpm} | {tracks} "
+    "| {notes} | {dur} | {comment} |"
+)
+# Table cells cannot contain a raw pipe
+_MD_PIPE_TABLE = str.maketrans({"|": "╎"})
+
+
+def _format_markdown_row(r: dict) -> str:
+    """Render one result dict as a row of the Markdown results table."""
+    m = r["metrics"]
+    bpm = m.get("bpm")
+    duration = m.get("duration_s")
+    return _MD_ROW_TEMPLATE.format(
+        id_short=r["test_id"].replace("tc_", ""),
+        test_id=r["test_id"],
+        status="✓ PASS" if r["passed"] else "✗ FAIL",
+        score=f"{r['weighted_score']:.2f}" if r["structural"]["file_parseable"] else "N/A",
+        bpm=f"{bpm:.0f}" if bpm else "—",
+        tracks=m.get("tracks") or "—",
+        notes=m.get("notes") or "—",
+        dur=f"{duration:.0f}" if duration else "—",
+        comment=r["comment"].translate(_MD_PIPE_TABLE),
+    )
 
 
 # ============================================================================
@@ -153,16 +394,34 @@ class TestRunner:
 
     def __init__(
         self,
-        test_cases: list[TestCase],
+        test_cases: Sequence[TestCase],
         dry_run: bool = False,
         verbose: bool = False,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        rpm: float = DEFAULT_RPM,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+        use_cache: bool = False,
+        refresh_cache: bool = False,
     ) -> None:
         self.test_cases = test_cases
         self.dry_run = dry_run
         self.verbose = verbose
-        self.evaluator = MidiEvaluator()
-        self.graph = None
+        self.concurrency = max(1, concurrency)
+        self.start_interval = 60.0 / rpm if rpm > 0 else 0.0
+        self.max_retries = max(0, max_retries)
+        self.use_cache = use_cache
+        self.refresh_cache = refresh_cache
         self._results: list[dict] = []
+        # Subset of _results that failed, so reporters need not re-filter
+        self._failures: list[dict] = []
+
+    @cached_property
+    def graph(self):
+        """The agentic graph, compiled on the first cache miss that needs it."""
+        print("[INIT] Loading agentic graph…")
+        graph = get_agentic_graph()
+        print("[INIT] Graph ready.\n")
+        return graph
 
     def run(self) -> dict:
         """Run all test cases and return a summary dict."""
@@ -174,73 +433,39 @@ class TestRunner:
               f"Available: {LLMConfig.AVAILABLE_PROVIDERS}")
         print(f"{'='*70}\n")
 
-        if not self.dry_run:
-            print("[INIT] Loading agentic graph…")
-            self.graph = get_agentic_graph()
-            print("[INIT] Graph ready.\n")
-
         start_time = time.monotonic()
         passed = 0
         failed = 0
 
-        for idx, tc in enumerate(self.test_cases, start=1):
-            print(f"[{idx:>3}/{len(self.test_cases)}] {tc.test_id}  – {tc.prompt[:55]}…")
-
-            # ── Generation step ──────────────────────────────────────────────
-            midi_path: str | None = None
-            gen_error: str | None = None
-            elapsed: float = 0.0
-
-            if self.dry_run:
-                # Look for existing file in output dir matching test_id prefix
-                existing = list(OUTPUTS_DIR.glob(f"{tc.test_id}_*.mid"))
-                if existing:
-                    midi_path = str(existing[0])
-                    print(f"         [dry-run] Using existing: {existing[0].name}")
-                else:
-                    gen_error = "dry-run: no pre-existing file found"
-            else:
-                midi_path, gen_error, elapsed = generate_midi_for_test(
-                    tc, self.graph, OUTPUTS_DIR
-                )
-                if gen_error:
-                    print(f"         [GEN FAIL] {gen_error[:120]}")
-
-            # ── Evaluation step ──────────────────────────────────────────────
-            eval_result = self.evaluator.evaluate(
-                test_id=tc.test_id,
-                prompt=tc.prompt,
-                midi_path=midi_path,
-                expected_tempo_range=tc.expected_tempo_range,
-                expected_track_count_range=tc.expected_track_count_range,
-                expected_note_count_range=tc.expected_note_count_range,
-                expected_duration_range=tc.expected_duration_range,
-                expected_pitch_range=tc.expected_pitch_range,
-                expected_has_drums=tc.expected_has_drums,
-                pass_threshold=tc.pass_threshold,
-            )
-
+        if self.dry_run:
+            # Nothing to overlap: collect the files, then score them in turn
+            generated = self._collect_existing()
+            eval_results = self._evaluate_all(generated)
+        else:
+            # Each case is scored as soon as its generation finishes, while
+            # the remaining generations are still waiting on the provider
+            generated, eval_results = asyncio.run(self._generate_all())
+
+        print()
+        for tc, (midi_path, gen_error, elapsed), eval_result in zip(
+            self.test_cases, generated, eval_results
+        ):
             status_icon = "✓" if eval_result.passed else "✗"
             score_str = f"{eval_result.weighted_score:.2f}" if eval_result.structural_ok else "N/A"
-            print(
-                f"         [{status_icon}] score={score_str:<5}  "
+            # All lines for one test go out in a single write
+            parts = [
+                f"  [{status_icon}] {tc.test_id:<12} score={score_str:<5}  "
                 f"gen={elapsed:.1f}s  "
                 + (f"bpm={eval_result.metrics.bpm:.0f}" if eval_result.metrics else "no-metrics")
-            )
-
-            if self.verbose and (eval_result.failures or eval_result.notes):
-                for msg in eval_result.failures:
-                    print(f"              FAIL: {msg}")
-                for msg in eval_result.notes:
-                    print(f"              note: {msg}")
-
-            if eval_result.passed:
-                passed += 1
-            else:
-                failed += 1
+                + "\n"
+            ]
+            if self.verbose:
+                parts.extend(f"              FAIL: {msg}\n" for msg in eval_result.failures)
+                parts.extend(f"              note: {msg}\n" for msg in eval_result.notes)
+            sys.stdout.write("".join(parts))
 
             # ── Collect structured result ────────────────────────────────────
-            self._results.append({
+            result = {
                 "test_id":        tc.test_id,
                 "comment":        tc.comment,
                 "prompt":         tc.prompt,
@@ -248,7 +473,7 @@ class TestRunner:
                 "weighted_score": round(eval_result.weighted_score, 4),
                 "pass_threshold": tc.pass_threshold,
                 "midi_path":      midi_path or "",
-                "gen_error":      gen_error or "",
+                "gen_error":      format_gen_error(gen_error, with_traceback=True),
                 "elapsed_s":      round(elapsed, 2),
                 "structural": {
                     "file_exists":    eval_result.file_exists,
@@ -272,28 +497,22 @@ class TestRunner:
                     "pitch_range":       tc.expected_pitch_range,
                     "has_drums":         tc.expected_has_drums,
                 },
-                "metrics": {
-                    "bpm":             round(eval_result.metrics.bpm, 1) if eval_result.metrics else None,
-                    "tracks":          eval_result.metrics.non_empty_track_count if eval_result.metrics else None,
-                    "notes":           eval_result.metrics.total_notes if eval_result.metrics else None,
-                    "duration_s":      round(eval_result.metrics.duration_seconds, 1) if eval_result.metrics else None,
-                    "avg_pitch":       round(eval_result.metrics.avg_pitch, 1) if eval_result.metrics else None,
-                    "vel_stddev":      round(eval_result.metrics.velocity_stddev, 1) if eval_result.metrics else None,
-                    "has_drums":       eval_result.metrics.has_drums if eval_result.metrics else None,
-                    "file_size_bytes": eval_result.metrics.file_size_bytes if eval_result.metrics else None,
-                },
+                "metrics": _pack_metrics(eval_result.metrics),
                 "notes":    eval_result.notes,
                 "failures": eval_result.failures,
-            })
-
-            # Rate-limit guard
-            if not self.dry_run and idx < len(self.test_cases):
-                time.sleep(INTER_TEST_DELAY_SECONDS)
+            }
+            self._results.append(result)
+            if eval_result.passed:
+                passed += 1
+            else:
+                failed += 1
+                self._failures.append(result)
 
         total_elapsed = time.monotonic() - start_time
 
+        finished_at = datetime.utcnow()
         summary = {
-            "run_timestamp": datetime.utcnow().isoformat() + "Z",
+            "run_timestamp": finished_at.isoformat() + "Z",
             "provider": LLMConfig.DEFAULT_PROVIDER,
             "total_tests":  len(self.test_cases),
             "passed":       passed,
@@ -301,14 +520,129 @@ class TestRunner:
             "pass_rate":    round(passed / len(self.test_cases) * 100, 1) if self.test_cases else 0,
             "total_elapsed_s": round(total_elapsed, 1),
             "results": self._results,
+            "failures": self._failures,
         }
 
+        # Both reports share one filename stem so they can be correlated
+        report_base = REPORTS_DIR / f"report_{finished_at.strftime('%Y%m%d_%H%M%S')}"
+
         self._print_summary(summary)
-        self._write_json_report(summary)
-        self._write_markdown_report(summary)
+        self._write_json_report(summary, report_base)
+        self._write_markdown_report(summary, report_base)
+        self._write_table_report(summary, report_base)
 
         return summary
 
+    def _collect_existing(self) -> list[tuple[str | None, str | BaseException | None, float]]:
+        """Dry-run stage 1: pick up previously generated files from outputs/."""
+        generated: list[tuple[str | None, str | BaseException | None, float]] = []
+        # One directory scan for the whole run, indexed by the "tc_NNN" prefix
+        existing_by_id: dict[str, os.DirEntry] = {}
+        with os.scandir(OUTPUTS_DIR) as entries:
+            for entry in entries:
+                if entry.name.endswith(".mid"):
+                    test_id = "_".join(entry.name.split("_", 2)[:2])
+                    existing_by_id.setdefault(test_id, entry)
+
+        for idx, tc in enumerate(self.test_cases, start=1):
+            print(f"[{idx:>3}/{len(self.test_cases)}] {tc.test_id}  – {tc.prompt[:55]}…")
+            existing = existing_by_id.get(tc.test_id)
+            if existing is not None:
+                print(f"         [dry-run] Using existing: {existing.name}")
+                generated.append((existing.path, None, 0.0))
+            else:
+                generated.append((None, "dry-run: no pre-existing file found", 0.0))
+        return generated
+
+    async def _generate_all(
+        self,
+    ) -> tuple[list[tuple[str | None, str | BaseException | None, float]], list]:
+        """Generate and evaluate every case, ``self.concurrency`` generations at a time.
+
+        Starts are spaced ``60 / rpm`` seconds apart so the provider sees a
+        steady request rate rather than a burst.  A rate-limited generation is
+        retried after a jittered exponential backoff, which also holds back
+        every other pending start.  Each finished file is
+        handed to a thread pool for evaluation without holding a generation
+        slot.  Returns ``(generated, eval_results)`` in ``self.test_cases`` order.
+        """
+        semaphore = asyncio.Semaphore(self.concurrency)
+        start_lock = asyncio.Lock()
+        loop = asyncio.get_running_loop()
+        next_start = loop.time()
+        total = len(self.test_cases)
+
+        async def generate_one(idx: int, tc: TestCase):
+            nonlocal next_start
+            if self.use_cache and not self.refresh_cache:
+                cached = load_cached_generation(tc, OUTPUTS_DIR)
+                if cached:
+                    print(f"[{idx:>3}/{total}] {tc.test_id}  [cache] {Path(cached).name}")
+                    return cached, None, 0.0
+
+            for attempt in range(self.max_retries + 1):
+                async with semaphore:
+                    async with start_lock:
+                        delay = next_start - loop.time()
+                        if delay > 0:
+                            await asyncio.sleep(delay)
+                        next_start = loop.time() + self.start_interval
+
+                    print(f"[{idx:>3}/{total}] {tc.test_id}  – {tc.prompt[:55]}…")
+                    # The graph is synchronous; run it off the event loop
+                    outcome = await asyncio.to_thread(
+                        generate_midi_for_test, tc, self.graph, OUTPUTS_DIR
+                    )
+
+                if attempt == self.max_retries or not _is_rate_limited(outcome[1]):
+                    break
+                backoff = random.uniform(
+                    0.0,
+                    min(RETRY_BACKOFF_CAP_SECONDS, RETRY_BACKOFF_BASE_SECONDS * 2 ** attempt),
+                )
+                print(f"         [RATE LIMIT] {tc.test_id}: retry "
+                      f"{attempt + 1}/{self.max_retries} in {backoff:.1f}s")
+                # Back the shared limiter off too, so other cases don't pile in
+                next_start = max(next_start, loop.time() + backoff)
+                await asyncio.sleep(backoff)
+
+            if outcome[1]:
+                print(f"         [GEN FAIL] {tc.test_id}: "
+                      f"{format_gen_error(outcome[1])[:120]}")
+            elif self.use_cache and outcome[0]:
+                store_cached_generation(tc, outcome[0])
+            return outcome
+
+        async def run_one(idx: int, tc: TestCase, eval_pool: ThreadPoolExecutor):
+            outcome = await generate_one(idx, tc)
+            eval_result = await loop.run_in_executor(
+                eval_pool, evaluate_test_case, tc, outcome[0]
+            )
+            return outcome, eval_result
+
+        # Threads rather than processes: a file scores in milliseconds, and
+        # forking while generation threads are live is best avoided
+        with ThreadPoolExecutor(max_workers=EVAL_WORKERS) as eval_pool:
+            pairs = await asyncio.gather(
+                *(run_one(idx, tc, eval_pool)
+                  for idx, tc in enumerate(self.test_cases, start=1))
+            )
+        return [outcome for outcome, _ in pairs], [result for _, result in pairs]
+
+    def _evaluate_all(
+        self, generated: list[tuple[str | None, str | BaseException | None, float]]
+    ) -> list:
+        """Evaluate every case serially, in test order.
+
+        A file scores in milliseconds, so a process pool's start-up (and, on
+        spawn platforms, re-importing this module and langgraph per worker)
+        costs more than it saves.
+        """
+        return [
+            evaluate_test_case(tc, midi_path)
+            for tc, (midi_path, _, _) in zip(self.test_cases, generated)
+        ]
+
     # ── Reporting helpers ────────────────────────────────────────────────────
 
     @staticmethod
@@ -327,73 +661,81 @@ class TestRunner:
 
         if failed:
             print("\n  Failed tests:")
-            for r in summary["results"]:
-                if not r["passed"]:
-                    score = f"{r['weighted_score']:.2f}" if r["structural"]["file_parseable"] else "N/A"
-                    print(f"    ✗ {r['test_id']:<12} score={score}  {r['prompt'][:50]}")
-                    for f in r["failures"]:
-                        print(f"        → {f}")
-
-    def _write_json_report(self, summary: dict) -> None:
-        ts = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
-        path = REPORTS_DIR / f"report_{ts}.json"
-        with open(path, "w", encoding="utf-8") as fh:
-            json.dump(summary, fh, indent=2, default=str)
+            for r in summary["failures"]:
+                score = f"{r['weighted_score']:.2f}" if r["structural"]["file_parseable"] else "N/A"
+                print(f"    ✗ {r['test_id']:<12} score={score}  {r['prompt'][:50]}")
+                for f in r["failures"]:
+                    print(f"        → {f}")
+
+    def _write_json_report(self, summary: dict, report_base: Path) -> None:
+        path = report_base.with_suffix(".json")
+        # Write the scalar fields, then one result object per line inside
+        # "results"; the document is the same JSON, just laid out line-wise.
+        results = summary["results"]
+        with open(path, "wb") as fh:
+            fh.write(b"{\n")
+            for key, value in summary.items():
+                # "failures" only re-lists failed entries of "results"
+                if key not in ("results", "failures"):
+                    fh.write(b"  " + _json_bytes(key) + b": " + _json_bytes(value) + b",\n")
+            fh.write(b'  "results": [')
+            for i, result in enumerate(results):
+                fh.write(b"\n    " if i == 0 else b",\n    ")
+                fh.write(_json_bytes(result))
+            fh.write(b"\n  ]\n}\n" if results else b"]\n}\n")
         print(f"\n[REPORT] JSON  → {path}")
 
-    def _write_markdown_report(self, summary: dict) -> None:
-        ts = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
-        path = REPORTS_DIR / f"report_{ts}.md"
-
-        lines = [
-            "# MIDI Generation Test Report",
-            "",
-            f"**Date**: {summary['run_timestamp']}  ",
-            f"**Provider**: `{summary['provider']}`  ",
-            f"**Pass rate**: {summary['pass_rate']}% ({summary['passed']}/{summary['total_tests']})  ",
-            f"**Total time**: {summary['total_elapsed_s']}s",
-            "",
-            "## Results",
-            "",
-            "| # | ID | Status | Score | BPM | Tracks | Notes | Dur(s) | Comment |",
-            "|---|-----|--------|-------|-----|--------|-------|--------|---------|",
-        ]
+    def _write_table_report(self, summary: dict, report_base: Path) -> None:
+        """Flat per-test table: Parquet (zstd) when pyarrow is installed, else CSV."""
+        rows = [_flatten_result(r) for r in summary["results"]]
+        if not rows:
+            return
+        if _PYARROW_AVAILABLE:
+            path = report_base.with_suffix(".parquet")
+            pq.write_table(pa.Table.from_pylist(rows), path, compression="zstd")
+        else:
+            path = report_base.with_suffix(".csv")
+            with open(path, "w", encoding="utf-8", newline="") as fh:
+                writer = csv.DictWriter(fh, fieldnames=list(rows[0]))
+                writer.writeheader()
+                writer.writerows(rows)
+        print(f"[REPORT] Table → {path}")
 
-        for r in summary["results"]:
-            status = "✓ PASS" if r["passed"] else "✗ FAIL"
-            score  = f"{r['weighted_score']:.2f}" if r["structural"]["file_parseable"] else "N/A"
-            m = r["metrics"]
-            bpm     = f"{m['bpm']:.0f}" if m.get("bpm") else "—"
-            tracks  = str(m.get("tracks") or "—")
-            notes   = str(m.get("notes") or "—")
-            dur     = f"{m['duration_s']:.0f}" if m.get("duration_s") else "—"
-            comment = r["comment"].replace("|", "╎")
-            lines.append(
-                f"| {r['test_id'].replace('tc_', '')} | `{r['test_id']}` | {status} "
-                f"| {score} | {bpm} | {tracks} | {notes} | {dur} | {comment} |"
-            )
+    def _write_markdown_report(self, summary: dict, report_base: Path) -> None:
+        path = report_base.with_suffix(".md")
 
-        lines += [
-            "",
-            "## Failed Tests (detail)",
-            "",
-        ]
-        for r in summary["results"]:
-            if not r["passed"]:
-                lines.append(f"### `{r['test_id']}`")
-                lines.append(f"**Prompt**: {r['prompt']}  ")
-                lines.append(f"**Comment**: {r['comment']}  ")
-                lines.append(f"**Score**: {r['weighted_score']:.2f}  ")
+        # Written straight to the file: no list of lines, no final join
+        with open(path, "w", encoding="utf-8") as fh:
+            w = fh.write
+            w(
+                "# MIDI Generation Test Report\n"
+                "\n"
+                f"**Date**: {summary['run_timestamp']}  \n"
+                f"**Provider**: `{summary['provider']}`  \n"
+                f"**Pass rate**: {summary['pass_rate']}% ({summary['passed']}/{summary['total_tests']})  \n"
+                f"**Total time**: {summary['total_elapsed_s']}s\n"
+                "\n"
+                "## Results\n"
+                "\n"
+                "| # | ID | Status | Score | BPM | Tracks | Notes | Dur(s) | Comment |\n"
+                "|---|-----|--------|-------|-----|--------|-------|--------|---------|\n"
+            )
+            for r in summary["results"]:
+                w(_format_markdown_row(r))
+                w("\n")
+
+            w("\n## Failed Tests (detail)\n")
+            for r in summary["failures"]:
+                w(f"\n### `{r['test_id']}`\n")
+                w(f"**Prompt**: {r['prompt']}  \n")
+                w(f"**Comment**: {r['comment']}  \n")
+                w(f"**Score**: {r['weighted_score']:.2f}  \n")
                 if r["gen_error"]:
-                    lines.append(f"**Generation error**: `{r['gen_error'][:200]}`")
+                    w(f"**Generation error**: `{r['gen_error'][:200]}`\n")
                 for failure in r["failures"]:
-                    lines.append(f"- {failure}")
+                    w(f"- {failure}\n")
                 for note in r["notes"]:
-                    lines.append(f"  - *{note}*")
-                lines.append("")
-
-        with open(path, "w", encoding="utf-8") as fh:
-            fh.write("\n".join(lines))
+                    w(f"  - *{note}*\n")
         print(f"[REPORT] MD    → {path}")
 
 
@@ -412,7 +754,12 @@ def main() -> None:
     )
     parser.add_argument(
         "--filter", type=str, default=None,
-        help="Only run test cases whose ID contains this substring (e.g. tc_001).",
+        help="Only run test cases whose ID contains this substring (e.g. tc_001), "
+             "or exactly match one of a comma-separated list (e.g. tc_001,tc_014).",
+    )
+    parser.add_argument(
+        "--genre", type=str, default=None, choices=GENRE_TAGS,
+        help="Only run test cases tagged with this genre (applied before --filter).",
     )
     parser.add_argument(
         "--dry-run", action="store_true",
@@ -422,6 +769,26 @@ def main() -> None:
         "--verbose", "-v", action="store_true",
         help="Print per-test notes and failure details inline.",
     )
+    parser.add_argument(
+        "--cache", action="store_true",
+        help="Reuse and update the (provider, prompt) generation cache.",
+    )
+    parser.add_argument(
+        "--refresh-cache", action="store_true",
+        help="Regenerate every case and overwrite its cache entry.",
+    )
+    parser.add_argument(
+        "--concurrency", type=int, default=DEFAULT_CONCURRENCY,
+        help=f"Generations to run in parallel (default {DEFAULT_CONCURRENCY}).",
+    )
+    parser.add_argument(
+        "--rpm", type=float, default=DEFAULT_RPM,
+        help=f"Maximum generation starts per minute; 0 disables spacing (default {DEFAULT_RPM}).",
+    )
+    parser.add_argument(
+        "--max-retries", type=int, default=DEFAULT_MAX_RETRIES,
+        help=f"Retries for a rate-limited generation (default {DEFAULT_MAX_RETRIES}).",
+    )
     args = parser.parse_args()
 
     # Initialise LLM
@@ -429,8 +796,20 @@ def main() -> None:
 
     # Filter test cases
     cases = TEST_CASES
+    if args.genre:
+        cases = cases_for_genre(args.genre)
+        print(f"[INFO] Filtered to {len(cases)} {args.genre} test cases")
     if args.filter:
-        cases = [tc for tc in cases if args.filter.lower() in tc.test_id.lower()]
+        needle = args.filter.lower()
+        if "," in needle:
+            # Comma-separated list → exact ID matches
+            wanted = frozenset(part.strip() for part in needle.split(","))
+            unknown = sorted(wanted.difference(TEST_CASES_BY_ID))
+            if unknown:
+                print(f"[WARN] Unknown test IDs ignored: {', '.join(unknown)}")
+            cases = [tc for tc in cases if tc.test_id in wanted]
+        else:
+            cases = [tc for tc in cases if needle in tc.test_id.lower()]
         print(f"[INFO] Filtered to {len(cases)} test cases matching '{args.filter}'")
     if args.limit:
         cases = cases[: args.limit]
@@ -440,7 +819,16 @@ def main() -> None:
         print("[ERROR] No test cases to run.")
         sys.exit(1)
 
-    runner = TestRunner(cases, dry_run=args.dry_run, verbose=args.verbose)
+    runner = TestRunner(
+        cases,
+        dry_run=args.dry_run,
+        verbose=args.verbose,
+        concurrency=args.concurrency,
+        rpm=args.rpm,
+        max_retries=args.max_retries,
+        use_cache=args.cache or args.refresh_cache,
+        refresh_cache=args.refresh_cache,
+    )
     summary = runner.run()
 
     sys.exit(0 if summary["failed"] == 0 else 1)
@@ -32,13 +32,17 @@ Note density thresholds are calibrated for a typical 60-second output.
 
 from __future__ import annotations
 
+import functools
+import re
+from collections.abc import Mapping
 from dataclasses import dataclass, field
+from types import MappingProxyType
 from typing import Optional, Tuple
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class TestCase:
-    """Single MIDI generation test case."""
+    """Single MIDI generation test case (immutable)."""
 
     test_id: str
     prompt: str
@@ -60,7 +64,7 @@ class TestCase:
 # TEST CASES – 110 entries
 # ============================================================================
 
-TEST_CASES: list[TestCase] = [
+TEST_CASES: tuple[TestCase, ...] = (
 
     # ── Lo-Fi / Chill ────────────────────────────────────────────────────────
 
@@ -1269,4 +1273,64 @@ TEST_CASES: list[TestCase] = [
         expected_duration_range=(30, 300),
         expected_has_drums=True,
     ),
-]
+)
+
+
+# Read-only test_id → TestCase lookup.
+TEST_CASES_BY_ID: Mapping[str, TestCase] = MappingProxyType(
+    {tc.test_id: tc for tc in TEST_CASES}
+)
+
+
+# ============================================================================
+# GENRE INDEX – built on first use
+# ============================================================================
+
+# Prompt keywords per genre tag.  Single words match whole prompt tokens
+# (so "pop" does not match "hip-hop" or "pops"); phrases match as substrings.
+_GENRE_KEYWORDS: dict[str, tuple[str, ...]] = {
+    "lofi":       ("lo-fi", "lofi"),
+    "ambient":    ("ambient", "drone"),
+    "classical":  ("classical", "baroque", "sonata", "symphony", "etude",
+                   "neoclassical", "string quartet"),
+    "jazz":       ("jazz", "jazz-hop", "bebop", "bossa", "big band"),
+    "electronic": ("electronic", "electronica", "house", "techno", "trance",
+                   "dubstep", "hardstyle", "synthpop", "downtempo",
+                   "drum and bass", "future bass"),
+    "pop":        ("pop", "k-pop", "synthpop", "hyperpop"),
+    "rock":       ("rock", "post-rock", "metal", "punk"),
+    "hiphop":     ("hip-hop", "jazz-hop", "trap", "drill", "boom-bap", "phonk"),
+    "rnb":        ("r&b", "rnb", "soul", "neo-soul", "funky", "motown"),
+    "cinematic":  ("cinematic", "film", "trailer", "thriller"),
+    "world":      ("raga", "flamenco", "djembe", "celtic", "koto", "salsa",
+                   "cumbia", "afrobeats"),
+    "country":    ("country", "bluegrass"),
+    "reggae":     ("reggae", "dub"),
+    "blues":      ("blues",),
+    "gospel":     ("gospel", "choir"),
+    "game":       ("game", "8-bit", "rpg"),
+}
+
+GENRE_TAGS: tuple[str, ...] = tuple(sorted(_GENRE_KEYWORDS))
+
+_TOKEN_RE = re.compile(r"[a-z0-9&]+(?:-[a-z0-9]+)*")
+
+
+@functools.cache
+def _index_by_genre() -> Mapping[str, tuple[TestCase, ...]]:
+    # Tokenising every prompt costs more than building the table itself, and
+    # only ``--genre`` needs it, so the index is built lazily.
+    index: dict[str, list[TestCase]] = {}
+    for tc in TEST_CASES:
+        prompt = tc.prompt.lower()
+        tokens = set(_TOKEN_RE.findall(prompt))
+        for genre, keywords in _GENRE_KEYWORDS.items():
+            if any((kw in prompt) if " " in kw else (kw in tokens) for kw in keywords):
+                index.setdefault(genre, []).append(tc)
+    return MappingProxyType({genre: tuple(cases) for genre, cases in index.items()})
+
+
+def cases_for_genre(genre: str) -> tuple[TestCase, ...]:
+    """Return every test case tagged with *genre* (see ``_GENRE_KEYWORDS``)."""
+    return _index_by_genre().get(genre.lower(), ())
+
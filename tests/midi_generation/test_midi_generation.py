@@ -21,35 +21,47 @@ which means you can run any subset with standard pytest selection flags:
 
 NOTE: These tests call the live LLM API and generate real MIDI.  Each test
 can take several seconds.  Running all 110 sequentially may take 20-30 minutes
-depending on the LLM provider's latency.
+depending on the LLM provider's latency.  Generation is I/O-bound, so the
+suite can be spread over pytest-xdist workers; both tests of a case are
+grouped onto the same worker (see ``conftest.py``):
+
+    uv run --with pytest-xdist pytest tests/midi_generation -n 8 --dist loadgroup
+
+Set ``MIDI_TEST_BATCH=N`` to generate all selected cases up front, N graph
+runs at a time, before the tests evaluate them.
 
 Set environment variable ``MIDI_TEST_DRY_RUN=1`` to skip generation and only
 evaluate pre-existing MIDI files in ``tests/midi_generation/outputs/``.
+
+Every run generates fresh MIDI by default.  Set ``MIDI_TEST_CACHE=1`` to
+share the runner's (provider, prompt) cache under
+``~/.cache/text2midi/generations`` instead: cached files are evaluated in
+place and only uncached prompts call the LLM.  The cache key ignores code
+changes, so leave it off when checking generator changes.
 """
 
 from __future__ import annotations
 
+import errno
 import os
+import secrets
 import shutil
-import sys
-import time
-import traceback
-import uuid
+from operator import attrgetter
 from pathlib import Path
 from typing import Optional
 
 import pytest
 
-_REPO_ROOT = Path(__file__).resolve().parent.parent.parent
-
-from tests.midi_generation.evaluator import MidiEvaluator
+from tests.midi_generation.runner import (
+    build_initial_state,
+    cached_generation_path,
+    store_cached_generation,
+)
 from tests.midi_generation.test_cases import TEST_CASES, TestCase
 
 _DRY_RUN = os.environ.get("MIDI_TEST_DRY_RUN", "0") == "1"
-_OUTPUTS_DIR = _REPO_ROOT / "tests" / "midi_generation" / "outputs"
-_OUTPUTS_DIR.mkdir(parents=True, exist_ok=True)
-
-_evaluator = MidiEvaluator()
+_USE_CACHE = os.environ.get("MIDI_TEST_CACHE", "0") == "1"
+_BATCH_SIZE = int(os.environ.get("MIDI_TEST_BATCH", "0") or 0)
 
 
 # ============================================================================
@@ -57,80 +69,144 @@ _evaluator = MidiEvaluator()
 # ============================================================================
 
 
-def _generate(tc: TestCase, agentic_graph, output_dir: Path) -> Optional[str]:
-    """Run the graph for *tc* and return the path of the saved MIDI file."""
-    from src.agents.state import MusicState
-
-    session_id = str(uuid.uuid4())[:8]
-
-    initial_state: MusicState = {
-        "user_prompt": tc.prompt,
-        "intent": None,
-        "track_plan": [],
-        "theory_validation": {},
-        "theory_valid": False,
-        "theory_issues": [],
-        "generated_tracks": [],
-        "generation_metadata": {},
-        "quality_report": None,
-        "refinement_attempts": 0,
-        "refinement_feedback": "",
-        "needs_refinement": False,
-        "final_midi_path": None,
-        "session_summary": "",
-        "messages": [],
-        "error": None,
-        "error_context": None,
-        "session_id": session_id,
-        "composition_state": {
-            "existing_tracks": [],
-            "tempo": 120,
-            "key": "C",
-            "genre": "auto",
-            "mode": "major",
-        },
-        "max_refinement_iterations": 1,
-        "current_iteration": 0,
-    }
-
-    config = {"configurable": {"thread_id": session_id}}
-    result = agentic_graph.invoke(initial_state, config=config)
+def _save_output(tc: TestCase, result: dict, output_dir: Path) -> tuple[Optional[str], Optional[str]]:
+    """Move the MIDI from a graph *result* into *output_dir*.
 
+    Returns ``(midi_path, None)`` on success or ``(None, error_message)``.
+    """
     if result.get("error"):
-        pytest.fail(
-            f"Generator error for {tc.test_id}: {result['error'][:300]}",
-            pytrace=False,
-        )
+        return None, f"Generator error for {tc.test_id}: {result['error'][:300]}"
 
     raw_path = result.get("final_midi_path")
     if raw_path is None:
-        pytest.fail(f"No final_midi_path returned for {tc.test_id}", pytrace=False)
+        return None, f"No final_midi_path returned for {tc.test_id}"
 
     src = Path(raw_path)
     if not src.exists():
-        pytest.fail(f"Expected MIDI at {raw_path} but file missing", pytrace=False)
+        return None, f"Expected MIDI at {raw_path} but file missing"
 
     dest = output_dir / f"{tc.test_id}_{src.name}"
-    shutil.move(str(src), str(dest))
-    return str(dest)
+    try:
+        os.replace(src, dest)  # single atomic rename on the same filesystem
+    except OSError as exc:
+        if exc.errno != errno.EXDEV:
+            raise
+        shutil.copy2(src, dest)
+        src.unlink()
+    if _USE_CACHE:
+        store_cached_generation(tc, str(dest))
+    return str(dest), None
 
 
-def _find_existing(tc: TestCase) -> Optional[str]:
-    """Return path of an existing MIDI file for *tc* (dry-run mode)."""
-    hits = list(_OUTPUTS_DIR.glob(f"{tc.test_id}_*.mid"))
-    return str(hits[0]) if hits else None
+def _generate(tc: TestCase, agentic_graph, output_dir: Path) -> Optional[str]:
+    """Run the graph for *tc* and return the path of the saved MIDI file.
+
+    With ``MIDI_TEST_CACHE=1`` a cached generation for the same
+    (provider, prompt) is used in place when available, and fresh
+    generations are added to the cache.
+    """
+    if _USE_CACHE:
+        cached = cached_generation_path(tc)
+        if cached is not None:
+            return str(cached)
+
+    session_id = secrets.token_hex(4)
+    config = {"configurable": {"thread_id": session_id}}
+    result = agentic_graph.invoke(build_initial_state(tc, session_id), config=config)
+
+    midi_path, error = _save_output(tc, result, output_dir)
+    if error is not None:
+        pytest.fail(error, pytrace=False)
+    return midi_path
+
+
+@pytest.fixture(scope="module", autouse=True)
+def pregenerated(request, output_dir, existing_outputs) -> dict[str, str]:
+    """Opt-in batched generation (``MIDI_TEST_BATCH=N``).
+
+    Generates every selected, uncached case up front with
+    ``agentic_graph.batch`` – N graph runs in flight at a time – and
+    returns ``test_id`` → MIDI path.  Cases that fail here are left out,
+    so their test generates them again and reports the error itself.
+    """
+    generated: dict[str, str] = {}
+    if _DRY_RUN or _BATCH_SIZE <= 0:
+        return generated
+
+    selected = {
+        item.callspec.params["tc"]
+        for item in request.session.items
+        if item.module is request.module and hasattr(item, "callspec")
+    }
+    pending = []
+    for tc in TEST_CASES:
+        if tc not in selected:
+            continue
+        cached = cached_generation_path(tc) if _USE_CACHE else None
+        if cached is not None:
+            generated[tc.test_id] = str(cached)
+        else:
+            pending.append(tc)
+
+    agentic_graph = request.getfixturevalue("agentic_graph") if pending else None
+    for start in range(0, len(pending), _BATCH_SIZE):
+        chunk = pending[start:start + _BATCH_SIZE]
+        session_ids = [secrets.token_hex(4) for _ in chunk]
+        results = agentic_graph.batch(
+            [build_initial_state(tc, sid) for tc, sid in zip(chunk, session_ids)],
+            [
+                {"configurable": {"thread_id": sid}, "max_concurrency": _BATCH_SIZE}
+                for sid in session_ids
+            ],
+            return_exceptions=True,
+        )
+        for tc, result in zip(chunk, results):
+            if isinstance(result, BaseException):
+                continue
+            midi_path, _ = _save_output(tc, result, output_dir)
+            if midi_path is not None:
+                generated[tc.test_id] = midi_path
+
+    existing_outputs.update(generated)
+    return generated
 
 
 # ============================================================================
 # Parametrized tests
 # ============================================================================
 
-# Build human-readable IDs for each parametrized case so pytest -v shows them
-_TC_IDS = [tc.test_id for tc in TEST_CASES]
+# Human-readable IDs for each parametrized case so pytest -v shows them
+_tc_id = attrgetter("test_id")
+
+
+def _has_constraints(tc: TestCase) -> bool:
+    return any([
+        tc.expected_tempo_range,
+        tc.expected_track_count_range,
+        tc.expected_note_count_range,
+        tc.expected_duration_range,
+        tc.expected_pitch_range,
+        tc.expected_has_drums is not None,
+    ])
+
+
+# Cases without content constraints are skipped at collection time, so their
+# content test never sets up fixtures or touches the outputs directory.
+_CONTENT_CASES = [
+    tc if _has_constraints(tc) else pytest.param(
+        tc,
+        marks=pytest.mark.skip(
+            reason=f"[{tc.test_id}] No content constraints defined – structural test only"
+        ),
+    )
+    for tc in TEST_CASES
+]
 
 
-@pytest.mark.parametrize("tc", TEST_CASES, ids=_TC_IDS)
-def test_midi_file_generated_and_valid(tc: TestCase, agentic_graph, output_dir):
+@pytest.mark.parametrize("tc", TEST_CASES, ids=_tc_id)
+def test_midi_file_generated_and_valid(
+    tc: TestCase, agentic_graph, output_dir, existing_outputs, evaluator, pregenerated
+):
     """
     Structural test: verify that generation completes and produces a
     non-empty, parseable MIDI file.
@@ -138,13 +214,16 @@ def test_midi_file_generated_and_valid(tc: TestCase, agentic_graph, output_dir):
     This test always runs, even in dry-run mode.
     """
     if _DRY_RUN:
-        midi_path = _find_existing(tc)
+        midi_path = existing_outputs.get(tc.test_id)
         if midi_path is None:
             pytest.skip(f"dry-run: no pre-existing file for {tc.test_id}")
+    elif tc.test_id in pregenerated:
+        midi_path = pregenerated[tc.test_id]
     else:
         midi_path = _generate(tc, agentic_graph, output_dir)
+        existing_outputs[tc.test_id] = midi_path
 
-    result = _evaluator.evaluate(
+    result = evaluator.evaluate(
         test_id=tc.test_id,
         prompt=tc.prompt,
         midi_path=midi_path,
@@ -156,40 +235,32 @@ def test_midi_file_generated_and_valid(tc: TestCase, agentic_graph, output_dir):
     assert result.file_parseable, f"[{tc.test_id}] MIDI file is not a valid/parseable MIDI"
 
 
-@pytest.mark.parametrize("tc", TEST_CASES, ids=_TC_IDS)
-def test_midi_content_matches_prompt(tc: TestCase, agentic_graph, output_dir):
+@pytest.mark.parametrize("tc", _CONTENT_CASES, ids=_tc_id)
+def test_midi_content_matches_prompt(
+    tc: TestCase, agentic_graph, output_dir, existing_outputs, evaluator
+):
     """
     Semantic / content evaluation test: verify that the generated MIDI
     satisfies the expected musical attributes derived from the prompt.
 
-    This test is skipped when no expected constraints are defined for a case.
+    This test is skipped when no expected constraints are defined for a case
+    (see ``_CONTENT_CASES``).
 
     Comment for each test case explains the specific trait being evaluated.
     """
-    # Skip if test defines no specific constraints
-    has_constraints = any([
-        tc.expected_tempo_range,
-        tc.expected_track_count_range,
-        tc.expected_note_count_range,
-        tc.expected_duration_range,
-        tc.expected_pitch_range,
-        tc.expected_has_drums is not None,
-    ])
-    if not has_constraints:
-        pytest.skip(f"[{tc.test_id}] No content constraints defined – structural test only")
-
     # Find MIDI (may already exist from test_midi_file_generated_and_valid run
     # in the same session; pytest-xdist workers may not share files, so we
     # regenerate if necessary – that is fine for content evaluation).
-    existing = _find_existing(tc)
+    existing = existing_outputs.get(tc.test_id)
     if _DRY_RUN or existing:
         midi_path = existing
         if midi_path is None:
             pytest.skip(f"dry-run: no pre-existing file for {tc.test_id}")
     else:
         midi_path = _generate(tc, agentic_graph, output_dir)
+        existing_outputs[tc.test_id] = midi_path
 
-    result = _evaluator.evaluate(
+    result = evaluator.evaluate(
         test_id=tc.test_id,
         prompt=tc.prompt,
         midi_path=midi_path,
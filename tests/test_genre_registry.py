@@ -23,6 +23,15 @@ from src.config.genre_registry import (
     resolve_scale,
     get_all_scale_names,
 )
+from src.analysis.genre_validator import GenreCharacteristic
+from src.app.constants import CHORD_PROGRESSIONS, GENRE_CONFIG, GM_INSTRUMENTS, SCALES
+from src.intent.schema import ParsedIntent, SUPPORTED_GENRES, SUPPORTED_SCALES
+
+
+_ORIGINAL_10_GENRES = frozenset({
+    "pop", "rock", "electronic", "hiphop", "jazz",
+    "blues", "classical", "lofi", "ambient", "cinematic",
+})
 
 
 # =====================================================================
@@ -171,11 +180,11 @@ class TestTempoScaleInstrument:
     def test_original_8_scales_present(self):
         original = {"major", "minor", "dorian", "mixolydian", "pentatonic_major",
                      "pentatonic_minor", "blues", "harmonic_minor"}
-        assert original.issubset(set(SCALES_EXTENDED.keys()))
+        assert original.issubset(SCALES_EXTENDED.keys())
 
     def test_world_scales_present(self):
         world = {"hijaz", "phrygian_dominant", "japanese_in", "whole_tone"}
-        assert world.issubset(set(SCALES_EXTENDED.keys()))
+        assert world.issubset(SCALES_EXTENDED.keys())
 
     def test_scale_intervals_are_valid(self):
         for name, intervals in SCALES_EXTENDED.items():
@@ -235,14 +244,9 @@ class TestTempoScaleInstrument:
 class TestBackwardCompatibility:
     """Ensure the original 10 genre IDs still work."""
 
-    @pytest.mark.parametrize("genre_id", [
-        "pop", "rock", "electronic", "hiphop", "jazz",
-        "blues", "classical", "lofi", "ambient", "cinematic",
-    ])
-    def test_original_genres_exist(self, genre_id):
-        node = get_genre(genre_id)
-        assert node is not None
-        assert node.id == genre_id
+    def test_original_genres_exist(self):
+        missing = _ORIGINAL_10_GENRES.difference(all_genre_ids())
+        assert not missing, f"Original genres missing from registry: {sorted(missing)}"
 
     def test_funk_alias_works(self):
         node = find_by_alias("funk")
@@ -259,7 +263,6 @@ class TestConstantsIntegration:
     """Verify that constants.py correctly imports from the registry."""
 
     def test_genre_config_populated(self):
-        from src.app.constants import GENRE_CONFIG
         assert len(GENRE_CONFIG) > 10
         assert "pop" in GENRE_CONFIG
         for genre, cfg in GENRE_CONFIG.items():
@@ -267,15 +270,12 @@ class TestConstantsIntegration:
             assert "mode" in cfg  # default_scale mapped to 'mode'
 
     def test_scales_match_registry(self):
-        from src.app.constants import SCALES
         assert SCALES is SCALES_EXTENDED
 
     def test_gm_instruments_match_registry(self):
-        from src.app.constants import GM_INSTRUMENTS
         assert GM_INSTRUMENTS is GM_INSTRUMENTS_EXTENDED
 
     def test_chord_progressions_cover_root_genres(self):
-        from src.app.constants import CHORD_PROGRESSIONS
         for root in ["pop", "rock", "jazz", "blues", "electronic", "classical"]:
             assert root in CHORD_PROGRESSIONS, f"Missing chord progressions for '{root}'"
 
@@ -289,29 +289,24 @@ class TestSchemaIntegration:
     """Verify that schema.py correctly uses the registry."""
 
     def test_all_root_genres_in_supported(self):
-        from src.intent.schema import SUPPORTED_GENRES
         for gid in ["pop", "rock", "jazz", "blues", "electronic", "ambient"]:
             assert gid in SUPPORTED_GENRES
 
     def test_world_genres_in_supported(self):
-        from src.intent.schema import SUPPORTED_GENRES
         for gid in ["jazz.bossa_nova", "african.afrobeat", "asian.bollywood"]:
             assert gid in SUPPORTED_GENRES
 
     def test_supported_scales_includes_world(self):
-        from src.intent.schema import SUPPORTED_SCALES
         assert "hijaz" in SUPPORTED_SCALES
         assert "phrygian_dominant" in SUPPORTED_SCALES
 
     def test_genre_alias_resolution_in_schema(self):
-        from src.intent.schema import ParsedIntent
         intent = ParsedIntent.model_validate({
             "genre": {"primary": "bossa nova", "confidence": 0.9},
         })
         assert "bossa" in intent.genre.primary.lower()
 
     def test_subgenre_direct_in_schema(self):
-        from src.intent.schema import ParsedIntent
         intent = ParsedIntent.model_validate({
             "genre": {"primary": "electronic.house", "confidence": 0.9},
         })
@@ -327,7 +322,6 @@ class TestGenreValidatorIntegration:
     """Verify the genre validator uses registry data."""
 
     def test_validator_has_world_genres(self):
-        from src.analysis.genre_validator import GenreCharacteristic
         genres = GenreCharacteristic.GENRES
         # Should have more than the original 9
         assert len(genres) > 15
@@ -10,6 +10,7 @@ Covers:
   - Engine integration (mock LLM for deterministic testing)
 
 Run with: pytest tests/test_intent_engine.py -v
+No async tests here, so PYTEST_DISABLE_PLUGIN_AUTOLOAD=1 is safe and cuts startup.
 """
 
 import json
@@ -43,6 +44,12 @@ from src.intent.schema import (
 from src.intent.engine import LLMIntentEngine, _fallback_keyword_parse
 
 
+def _fallback_parse(text: str) -> ParsedIntent:
+    """Run the keyword fallback parser on *text* as the engine would."""
+    preprocessed = preprocess(text)
+    return _fallback_keyword_parse(preprocessed.normalized, preprocessed)
+
+
 # =====================================================================
 # SECTION 1: Schema Validation Tests
 # =====================================================================
@@ -249,28 +256,45 @@ class TestHardNumberExtraction:
 class TestKeywordFallback:
 
     def _run_fallback(self, text: str) -> ParsedIntent:
-        preprocessed = preprocess(text)
-        return _fallback_keyword_parse(preprocessed.normalized, preprocessed)
-
-    def test_genre_detection_lofi(self):
-        result = self._run_fallback("make a lofi beat")
-        assert result.genre.primary == "lofi"
-
-    def test_genre_detection_jazz(self):
-        result = self._run_fallback("smooth jazz quartet")
-        assert result.genre.primary == "jazz.smooth"
-
-    def test_genre_detection_ambient(self):
-        result = self._run_fallback("ambient soundscape")
-        assert result.genre.primary == "ambient"
-
-    def test_energy_high(self):
-        result = self._run_fallback("intense energetic rock")
-        assert result.energy.level == "high"
-
-    def test_energy_low(self):
-        result = self._run_fallback("calm peaceful melody")
-        assert result.energy.level == "low"
+        return _fallback_parse(text)
+
+    @pytest.mark.parametrize("text, genre, mood, energy", [
+        pytest.param("make a lofi beat", "lofi", None, None, id="genre-lofi"),
+        pytest.param("smooth jazz quartet", "jazz.smooth", None, None, id="genre-jazz"),
+        pytest.param("ambient soundscape", "ambient", None, None, id="genre-ambient"),
+        pytest.param("intense energetic rock", None, None, "high", id="energy-high"),
+        pytest.param("calm peaceful melody", None, None, "low", id="energy-low"),
+        # Contextual inference (no explicit genre keyword)
+        pytest.param("music for studying late at night", "lofi", "calm", "low",
+                     id="context-studying-lofi"),
+        pytest.param("something for my workout session", "electronic", None, "high",
+                     id="context-workout-electronic"),
+        pytest.param("meditation background sounds", "ambient", None, "low",
+                     id="context-meditation-ambient"),
+        pytest.param("something for the party tonight", "electronic", None, "high",
+                     id="context-party-electronic"),
+        pytest.param("gentle music for sleeping", "ambient", None, None,
+                     id="context-sleeping-ambient"),
+        pytest.param("background music for a coffee shop", "jazz", None, None,
+                     id="context-coffee-jazz"),
+        pytest.param("creepy music for a horror scene", "cinematic", None, None,
+                     id="context-horror-cinematic"),
+        pytest.param("music for a movie trailer", "cinematic", None, None,
+                     id="context-film-cinematic"),
+        pytest.param("something for a road trip", "rock", None, None,
+                     id="context-driving-rock"),
+        # Explicit genre keyword should win over contextual inference
+        pytest.param("classical music for studying", "classical", None, None,
+                     id="explicit-genre-overrides-context"),
+    ])
+    def test_keyword_detection(self, text, genre, mood, energy):
+        result = self._run_fallback(text)
+        if genre is not None:
+            assert result.genre.primary == genre
+        if mood is not None:
+            assert result.mood.primary == mood
+        if energy is not None:
+            assert result.energy.level == energy
 
     def test_tempo_extraction(self):
         result = self._run_fallback("electronic track at 128 bpm")
@@ -297,102 +321,64 @@ class TestKeywordFallback:
         assert result.genre.primary == "pop"
         assert result.overall_confidence <= 0.5
 
-    # -- Contextual inference tests (no explicit genre keyword) --
-
-    def test_context_studying_maps_to_lofi(self):
-        result = self._run_fallback("music for studying late at night")
-        assert result.genre.primary == "lofi"
-        assert result.mood.primary == "calm"
-        assert result.energy.level == "low"
-
-    def test_context_workout_maps_to_electronic(self):
-        result = self._run_fallback("something for my workout session")
-        assert result.genre.primary == "electronic"
-        assert result.energy.level == "high"
-
-    def test_context_meditation_maps_to_ambient(self):
-        result = self._run_fallback("meditation background sounds")
-        assert result.genre.primary == "ambient"
-        assert result.energy.level == "low"
-
-    def test_context_party_maps_to_electronic(self):
-        result = self._run_fallback("something for the party tonight")
-        assert result.genre.primary == "electronic"
-        assert result.energy.level == "high"
-
-    def test_context_sleeping_maps_to_ambient(self):
-        result = self._run_fallback("gentle music for sleeping")
-        assert result.genre.primary == "ambient"
-
-    def test_context_coffee_maps_to_jazz(self):
-        result = self._run_fallback("background music for a coffee shop")
-        assert result.genre.primary == "jazz"
-
-    def test_context_horror_maps_to_cinematic(self):
-        result = self._run_fallback("creepy music for a horror scene")
-        assert result.genre.primary == "cinematic"
-
-    def test_context_film_maps_to_cinematic(self):
-        result = self._run_fallback("music for a movie trailer")
-        assert result.genre.primary == "cinematic"
-
-    def test_explicit_genre_overrides_context(self):
-        """Explicit genre keyword should win over contextual inference."""
-        result = self._run_fallback("classical music for studying")
-        assert result.genre.primary == "classical"
-
-    def test_context_driving_maps_to_rock(self):
-        result = self._run_fallback("something for a road trip")
-        assert result.genre.primary == "rock"
-
 
 # =====================================================================
 # SECTION 4: Engine Integration Tests (with mock LLM)
 # =====================================================================
 
 
+@pytest.fixture(scope="class")
+def engine() -> LLMIntentEngine:
+    """The engine is stateless (config is read per parse), so one serves a class."""
+    return LLMIntentEngine()
+
+
+# A valid LLM response that ParsedIntent will accept; serialized once.
+_VALID_LLM_RESPONSE = {
+    "reasoning": "Mock LLM reasoning",
+    "action": "new",
+    "genre": {"primary": "cinematic", "secondary": None, "confidence": 0.9},
+    "mood": {"primary": "epic", "secondary": "dramatic", "valence": 0.6, "confidence": 0.9},
+    "energy": {"level": "high", "confidence": 0.85},
+    "tempo": {"bpm": 90, "source": "explicit", "confidence": 0.99},
+    "key": {"root": "D", "scale": "minor", "confidence": 0.95},
+    "duration": {"bars": 45, "seconds": 120, "descriptor": "medium", "confidence": 0.9},
+    "instruments": [
+        {"name": "strings", "role": "harmony", "priority": 9},
+        {"name": "brass", "role": "lead", "priority": 8},
+    ],
+    "dynamics": {"intensity": "powerful", "arc": "build"},
+    "structure": {
+        "has_intro": True,
+        "has_verse": True,
+        "has_chorus": True,
+        "has_bridge": True,
+        "has_outro": True,
+        "form_hint": None,
+    },
+    "production": {"descriptors": ["orchestral"], "complexity": "rich"},
+    "reference": None,
+    "overall_confidence": 0.92,
+}
+_VALID_LLM_JSON = json.dumps(_VALID_LLM_RESPONSE)
+
+
 class TestLLMIntentEngine:
     """Test the full engine pipeline with mocked LLM responses."""
 
     def _make_valid_llm_response(self, **overrides) -> str:
         """Build a valid JSON response that ParsedIntent will accept."""
-        base = {
-            "reasoning": "Mock LLM reasoning",
-            "action": "new",
-            "genre": {"primary": "cinematic", "secondary": None, "confidence": 0.9},
-            "mood": {"primary": "epic", "secondary": "dramatic", "valence": 0.6, "confidence": 0.9},
-            "energy": {"level": "high", "confidence": 0.85},
-            "tempo": {"bpm": 90, "source": "explicit", "confidence": 0.99},
-            "key": {"root": "D", "scale": "minor", "confidence": 0.95},
-            "duration": {"bars": 45, "seconds": 120, "descriptor": "medium", "confidence": 0.9},
-            "instruments": [
-                {"name": "strings", "role": "harmony", "priority": 9},
-                {"name": "brass", "role": "lead", "priority": 8},
-            ],
-            "dynamics": {"intensity": "powerful", "arc": "build"},
-            "structure": {
-                "has_intro": True,
-                "has_verse": True,
-                "has_chorus": True,
-                "has_bridge": True,
-                "has_outro": True,
-                "form_hint": None,
-            },
-            "production": {"descriptors": ["orchestral"], "complexity": "rich"},
-            "reference": None,
-            "overall_confidence": 0.92,
-        }
-        base.update(overrides)
-        return json.dumps(base)
+        if not overrides:
+            return _VALID_LLM_JSON
+        return json.dumps({**_VALID_LLM_RESPONSE, **overrides})
 
     @patch("src.intent.engine.call_llm")
     @patch("src.intent.engine.LLMConfig")
-    def test_successful_parse(self, mock_config, mock_call_llm):
+    def test_successful_parse(self, mock_config, mock_call_llm, engine):
         """Full pipeline with a valid LLM response."""
         mock_config.AVAILABLE_PROVIDERS = ["minimax"]
         mock_call_llm.return_value = self._make_valid_llm_response()
 
-        engine = LLMIntentEngine()
         parsed, enhanced, music_intent = engine.parse("epic cinematic piece in D minor at 90 BPM")
 
         assert parsed.genre.primary == "cinematic"
@@ -403,12 +389,11 @@ class TestLLMIntentEngine:
 
     @patch("src.intent.engine.call_llm")
     @patch("src.intent.engine.LLMConfig")
-    def test_fallback_on_llm_failure(self, mock_config, mock_call_llm):
+    def test_fallback_on_llm_failure(self, mock_config, mock_call_llm, engine):
         """When LLM returns None, fallback to keywords."""
         mock_config.AVAILABLE_PROVIDERS = ["minimax"]
         mock_call_llm.return_value = None
 
-        engine = LLMIntentEngine()
         parsed, enhanced, music_intent = engine.parse("ambient soundscape")
 
         # Should still produce a valid result via keyword fallback
@@ -417,7 +402,7 @@ class TestLLMIntentEngine:
 
     @patch("src.intent.engine.call_llm")
     @patch("src.intent.engine.LLMConfig")
-    def test_retry_on_validation_error(self, mock_config, mock_call_llm):
+    def test_retry_on_validation_error(self, mock_config, mock_call_llm, engine):
         """When first LLM response is invalid, engine retries once."""
         mock_config.AVAILABLE_PROVIDERS = ["minimax"]
 
@@ -426,7 +411,6 @@ class TestLLMIntentEngine:
         valid_response = self._make_valid_llm_response()
         mock_call_llm.side_effect = [invalid_response, valid_response]
 
-        engine = LLMIntentEngine()
         parsed, enhanced, music_intent = engine.parse("cinematic piece")
 
         assert parsed.genre.primary == "cinematic"
@@ -434,7 +418,7 @@ class TestLLMIntentEngine:
 
     @patch("src.intent.engine.call_llm")
     @patch("src.intent.engine.LLMConfig")
-    def test_hard_numbers_override_llm(self, mock_config, mock_call_llm):
+    def test_hard_numbers_override_llm(self, mock_config, mock_call_llm, engine):
         """Preprocessor-extracted tempo should override LLM-inferred tempo."""
         mock_config.AVAILABLE_PROVIDERS = ["minimax"]
         # LLM says 90 BPM but the prompt says "128 bpm"
@@ -442,7 +426,6 @@ class TestLLMIntentEngine:
             tempo={"bpm": 90, "source": "inferred", "confidence": 0.5}
         )
 
-        engine = LLMIntentEngine()
         parsed, enhanced, music_intent = engine.parse("electronic track at 128 bpm")
 
         # Preprocessor should catch "128 bpm" and override
@@ -450,11 +433,10 @@ class TestLLMIntentEngine:
         assert parsed.tempo.source == "explicit"
 
     @patch("src.intent.engine.LLMConfig")
-    def test_no_providers_uses_fallback(self, mock_config):
+    def test_no_providers_uses_fallback(self, mock_config, engine):
         """When no LLM providers are configured, use keyword fallback."""
         mock_config.AVAILABLE_PROVIDERS = []
 
-        engine = LLMIntentEngine()
         parsed, enhanced, music_intent = engine.parse("jazz in Bb")
 
         assert parsed.genre.primary == "jazz"
@@ -462,12 +444,11 @@ class TestLLMIntentEngine:
 
     @patch("src.intent.engine.call_llm")
     @patch("src.intent.engine.LLMConfig")
-    def test_markdown_fences_stripped(self, mock_config, mock_call_llm):
+    def test_markdown_fences_stripped(self, mock_config, mock_call_llm, engine):
         """LLM wrapping JSON in ```json fences should still parse."""
         mock_config.AVAILABLE_PROVIDERS = ["minimax"]
         mock_call_llm.return_value = f"```json\n{self._make_valid_llm_response()}\n```"
 
-        engine = LLMIntentEngine()
         parsed, _, _ = engine.parse("cinematic piece")
         assert parsed.genre.primary == "cinematic"
 
@@ -485,8 +466,7 @@ class TestPromptAccuracy:
     """
 
     def _parse(self, text: str) -> ParsedIntent:
-        preprocessed = preprocess(text)
-        return _fallback_keyword_parse(preprocessed.normalized, preprocessed)
+        return _fallback_parse(text)
 
     def test_compound_dark_ambient(self):
         result = self._parse("dark ambient drone")
@@ -547,8 +527,7 @@ class TestTrackChannelExtraction:
     and propagated correctly through the full pipeline."""
 
     def _parse(self, text: str) -> ParsedIntent:
-        preprocessed = preprocess(text)
-        return _fallback_keyword_parse(preprocessed.normalized, preprocessed)
+        return _fallback_parse(text)
 
     # --- Preprocessor extraction ---
 
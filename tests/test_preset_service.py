@@ -4,10 +4,11 @@
 from __future__ import annotations
 
 from pathlib import Path
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock
 
 import pytest
 
+import src.services.preset_service as preset_service_mod
 from src.services.preset_service import (
     GENRE_EMOJI,
     PresetService,
@@ -20,10 +21,28 @@ from src.services.preset_service import (
 # Fixtures
 # ------------------------------------------------------------------ #
 
+@pytest.fixture(scope="module")
+def svc(tmp_path_factory: pytest.TempPathFactory) -> PresetService:
+    """Shared PresetService with small cache and isolated temp persistence."""
+    persist_path = tmp_path_factory.mktemp("preset") / "test_cache.json"
+    return PresetService(cache_max=10, persist_path=persist_path)
+
+
+@pytest.fixture(autouse=True)
+def _restore_cache(svc: PresetService):
+    """Roll the shared service's in-memory cache back after each test."""
+    snapshot = svc._cache.copy()
+    yield
+    svc._cache.clear()
+    svc._cache.update(snapshot)
+
+
 @pytest.fixture
-def svc(tmp_path: Path) -> PresetService:
-    """Fresh PresetService with small cache and isolated temp persistence."""
-    return PresetService(cache_max=10, persist_path=tmp_path / "test_cache.json")
+def llm_mock(monkeypatch: pytest.MonkeyPatch) -> MagicMock:
+    """Replace ``call_llm`` in the preset service with a MagicMock."""
+    mock = MagicMock()
+    monkeypatch.setattr(preset_service_mod, "call_llm", mock)
+    return mock
 
 
 # ------------------------------------------------------------------ #
@@ -87,7 +106,7 @@ class TestGenreHierarchy:
 class TestSeedPresets:
     """Test the curated seed preset fallback system."""
 
-    def test_all_root_genres_have_seeds(self) -> None:
+    def test_all_root_genres_have_seeds(self, svc: PresetService) -> None:
         root_ids = {
             "classical", "jazz", "blues", "rock", "metal",
             "electronic", "hiphop", "pop", "rnb", "folk",
@@ -96,7 +115,7 @@ class TestSeedPresets:
         }
         for gid in root_ids:
             # lofi and ambient may fall back to parent seeds
-            seeds = PresetService().get_seed_presets(gid)
+            seeds = svc.get_seed_presets(gid)
             assert len(seeds) >= 1, f"No seeds available for root genre: {gid}"
 
     def test_seed_presets_are_nonempty_strings(self) -> None:
@@ -127,44 +146,38 @@ class TestSeedPresets:
 class TestGeneratePresets:
     """Test LLM-based preset generation with mocked call_llm."""
 
-    @patch("src.services.preset_service.call_llm")
-    def test_generate_presets_parses_json(self, mock_llm: MagicMock, svc: PresetService) -> None:
-        mock_llm.return_value = '["Create a cool jazz piece with muted trumpet", "Write a smooth jazz ballad with piano and bass", "Compose bebop with fast saxophone runs"]'
+    def test_generate_presets_parses_json(self, llm_mock: MagicMock, svc: PresetService) -> None:
+        llm_mock.return_value = '["Create a cool jazz piece with muted trumpet", "Write a smooth jazz ballad with piano and bass", "Compose bebop with fast saxophone runs"]'
         prompts = svc.generate_presets("jazz.cool")
         assert len(prompts) == 3
         assert "cool jazz" in prompts[0].lower()
-        mock_llm.assert_called_once()
+        llm_mock.assert_called_once()
 
-    @patch("src.services.preset_service.call_llm")
-    def test_generate_presets_handles_markdown_fences(self, mock_llm: MagicMock, svc: PresetService) -> None:
-        mock_llm.return_value = '```json\n["Create a dark ambient drone with deep bass", "Generate an eerie soundscape with metallic textures"]\n```'
+    def test_generate_presets_handles_markdown_fences(self, llm_mock: MagicMock, svc: PresetService) -> None:
+        llm_mock.return_value = '```json\n["Create a dark ambient drone with deep bass", "Generate an eerie soundscape with metallic textures"]\n```'
         prompts = svc.generate_presets("cinematic.dark_ambient")
         assert len(prompts) == 2
 
-    @patch("src.services.preset_service.call_llm")
-    def test_generate_presets_falls_back_on_llm_failure(self, mock_llm: MagicMock, svc: PresetService) -> None:
-        mock_llm.return_value = None
+    def test_generate_presets_falls_back_on_llm_failure(self, llm_mock: MagicMock, svc: PresetService) -> None:
+        llm_mock.return_value = None
         prompts = svc.generate_presets("jazz.bebop")
         # Should fall back to seed presets
         assert len(prompts) >= 2
 
-    @patch("src.services.preset_service.call_llm")
-    def test_generate_presets_falls_back_on_bad_json(self, mock_llm: MagicMock, svc: PresetService) -> None:
-        mock_llm.return_value = "This is not JSON at all"
+    def test_generate_presets_falls_back_on_bad_json(self, llm_mock: MagicMock, svc: PresetService) -> None:
+        llm_mock.return_value = "This is not JSON at all"
         prompts = svc.generate_presets("rock.punk")
         # Should fall back to seed presets
         assert len(prompts) >= 1
 
-    @patch("src.services.preset_service.call_llm")
-    def test_generate_presets_filters_short_prompts(self, mock_llm: MagicMock, svc: PresetService) -> None:
-        mock_llm.return_value = '["Good prompt with enough detail here", "too short", "Another great detailed prompt for testing"]'
+    def test_generate_presets_filters_short_prompts(self, llm_mock: MagicMock, svc: PresetService) -> None:
+        llm_mock.return_value = '["Good prompt with enough detail here", "too short", "Another great detailed prompt for testing"]'
         prompts = svc.generate_presets("pop.synth_pop")
         # "too short" should be filtered out (< 15 chars)
         assert len(prompts) == 2
 
-    @patch("src.services.preset_service.call_llm")
-    def test_generate_presets_extracts_quoted_strings_fallback(self, mock_llm: MagicMock, svc: PresetService) -> None:
-        mock_llm.return_value = 'Here are some ideas: "Create a lush electronic track with deep bass" and "Compose ambient music with floating pads"'
+    def test_generate_presets_extracts_quoted_strings_fallback(self, llm_mock: MagicMock, svc: PresetService) -> None:
+        llm_mock.return_value = 'Here are some ideas: "Create a lush electronic track with deep bass" and "Compose ambient music with floating pads"'
         prompts = svc.generate_presets("electronic.house")
         assert len(prompts) == 2
 
@@ -176,26 +189,24 @@ class TestGeneratePresets:
 class TestCache:
     """Test the LRU caching behavior."""
 
-    @patch("src.services.preset_service.call_llm")
-    def test_cache_hit_avoids_llm_call(self, mock_llm: MagicMock, svc: PresetService) -> None:
-        mock_llm.return_value = '["First call prompt number one here", "First call prompt number two here"]'
+    def test_cache_hit_avoids_llm_call(self, llm_mock: MagicMock, svc: PresetService) -> None:
+        llm_mock.return_value = '["First call prompt number one here", "First call prompt number two here"]'
         # First call
         prompts1 = svc.generate_presets("jazz.bebop")
-        assert mock_llm.call_count == 1
+        assert llm_mock.call_count == 1
         # Second call — should hit cache
         prompts2 = svc.generate_presets("jazz.bebop")
-        assert mock_llm.call_count == 1  # No additional LLM call
+        assert llm_mock.call_count == 1  # No additional LLM call
         assert prompts1 == prompts2
 
-    @patch("src.services.preset_service.call_llm")
-    def test_bypass_cache_makes_new_call(self, mock_llm: MagicMock, svc: PresetService) -> None:
-        mock_llm.return_value = '["First call prompt detailing jazz", "Another first call prompt for jazz"]'
+    def test_bypass_cache_makes_new_call(self, llm_mock: MagicMock, svc: PresetService) -> None:
+        llm_mock.return_value = '["First call prompt detailing jazz", "Another first call prompt for jazz"]'
         svc.generate_presets("jazz.bebop")
-        assert mock_llm.call_count == 1
+        assert llm_mock.call_count == 1
 
-        mock_llm.return_value = '["Second call new fresh prompt here", "Another fresh prompt for second call"]'
+        llm_mock.return_value = '["Second call new fresh prompt here", "Another fresh prompt for second call"]'
         prompts = svc.generate_presets("jazz.bebop", bypass_cache=True)
-        assert mock_llm.call_count == 2
+        assert llm_mock.call_count == 2
         assert "Second call" in prompts[0] or "fresh" in prompts[0].lower()
 
     def test_cache_eviction(self, tmp_path: Path) -> None:
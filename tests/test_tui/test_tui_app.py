@@ -5,52 +5,56 @@ Uses Textual's built-in app testing pilot.
 """
 
 import pytest
+import pytest_asyncio
 
 from main_tui import Text2MidiApp
 
 
+@pytest_asyncio.fixture(scope="class", loop_scope="class")
+async def mounted_app():
+    """One mounted app shared by the read-only smoke tests in a class."""
+    app = Text2MidiApp()
+    async with app.run_test(size=(120, 40)):
+        yield app
+
+
 class TestTuiAppLaunch:
-    """Smoke tests — verify the app composes and mounts without errors."""
+    """Smoke tests — verify the app composes and mounts without errors.
 
-    @pytest.mark.asyncio
-    async def test_app_launches(self):
+    Tests that only query widgets share ``mounted_app``; tests that push
+    screens or toggle widgets start their own app.
+    """
+
+    @pytest.mark.asyncio(loop_scope="class")
+    async def test_app_launches(self, mounted_app):
         """App should start and compose all widgets."""
-        app = Text2MidiApp()
-        async with app.run_test(size=(120, 40)) as pilot:
-            # Verify main containers exist
-            assert app.query_one("#main-horizontal") is not None
-            assert app.query_one("#sidebar") is not None
-            assert app.query_one("#main-content") is not None
+        app = mounted_app
+        # Verify main containers exist
+        assert app.query_one("#main-horizontal") is not None
+        assert app.query_one("#sidebar") is not None
+        assert app.query_one("#main-content") is not None
 
-    @pytest.mark.asyncio
-    async def test_prompt_widget_exists(self):
-        app = Text2MidiApp()
-        async with app.run_test(size=(120, 40)) as pilot:
-            prompt_widget = app.query_one("#prompt-widget")
-            assert prompt_widget is not None
+    @pytest.mark.asyncio(loop_scope="class")
+    async def test_prompt_widget_exists(self, mounted_app):
+        prompt_widget = mounted_app.query_one("#prompt-widget")
+        assert prompt_widget is not None
 
-    @pytest.mark.asyncio
-    async def test_progress_panel_hidden_initially(self):
-        app = Text2MidiApp()
-        async with app.run_test(size=(120, 40)) as pilot:
-            progress = app.query_one("#progress-panel")
-            assert "visible" not in progress.classes
+    @pytest.mark.asyncio(loop_scope="class")
+    async def test_progress_panel_hidden_initially(self, mounted_app):
+        progress = mounted_app.query_one("#progress-panel")
+        assert "visible" not in progress.classes
 
-    @pytest.mark.asyncio
-    async def test_output_panel_hidden_initially(self):
-        app = Text2MidiApp()
-        async with app.run_test(size=(120, 40)) as pilot:
-            output = app.query_one("#output-panel")
-            assert "visible" not in output.classes
+    @pytest.mark.asyncio(loop_scope="class")
+    async def test_output_panel_hidden_initially(self, mounted_app):
+        output = mounted_app.query_one("#output-panel")
+        assert "visible" not in output.classes
 
-    @pytest.mark.asyncio
-    async def test_sidebar_has_presets(self):
-        app = Text2MidiApp()
-        async with app.run_test(size=(120, 40)) as pilot:
-            tree = app.query_one("#sidebar-tree")
-            assert tree is not None
+    @pytest.mark.asyncio(loop_scope="class")
+    async def test_sidebar_has_presets(self, mounted_app):
+        tree = mounted_app.query_one("#sidebar-tree")
+        assert tree is not None
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="class")
     async def test_help_screen(self):
         """F1 should push the help screen."""
         app = Text2MidiApp()
@@ -59,7 +63,7 @@ class TestTuiAppLaunch:
             # Help screen should now be on the screen stack
             assert len(app.screen_stack) > 1
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="class")
     async def test_toggle_sidebar(self):
         """Ctrl+H should toggle sidebar visibility."""
         app = Text2MidiApp()